@@ -0,0 +1,4 @@
+"""
+Stock Prophet
+AI-powered stock price forecasting (Streamlit dashboard, CLI and library)
+"""
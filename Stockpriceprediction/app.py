@@ -7,14 +7,17 @@ import streamlit as st
 import pandas as pd
 import requests
 from datetime import datetime, date, timedelta
-import plotly.graph_objects as go
-import plotly.express as px
 
 # Import components
 from components.data_sources import DataSources
 from components.prediction_engine import PredictionEngine
 from components.ui_components import UIComponents
-from components.stock_data import POPULAR_STOCKS
+from components.stock_data import POPULAR_STOCKS, FORECAST_HORIZON_MONTHS, FORECAST_HORIZON_YEARS
+from components.forecasting import UNCERTAINTY_SAMPLES
+from components.ingest import partition_by_symbol
+from components.indicators import INDICATOR_CACHE
+from components.rolling_stats import ROLLING_STATS_CACHE
+from components.rate_limiter import RATE_LIMITER
 
 def main():
     # Enhanced Custom CSS for modern, eye-catching layout with DARK THEME
@@ -601,14 +604,21 @@ def main():
         if data_source == "🌟 Alpha Vantage API":
             st.info("🇺🇸 **US Markets Focus**\n⚡ 25 requests/day (free tier)")
             api_key = st.text_input("🔐 API Key:", type="password", help="Get your free key from alphavantage.co")
+            if api_key:
+                st.caption(f"📊 {RATE_LIMITER.remaining('alpha_vantage', api_key)} requests left today")
             
         elif data_source == "💼 Financial Modeling Prep":
             st.info("🌍 **Global Markets Coverage**\n⚡ 250 requests/day (free tier)")
             api_key = st.text_input("🔐 API Key:", value="demo", help="Use 'demo' for testing")
+            if api_key:
+                st.caption(f"📊 {RATE_LIMITER.remaining('fmp', api_key)} requests left today")
             
         else:  # CSV Upload
             st.info("📈 **Your Own Data**\n♾️ Unlimited usage")
-            uploaded_file = st.file_uploader("📁 Upload CSV file", type=['csv'])
+            uploaded_file = st.file_uploader(
+                "📁 Upload CSV or Parquet file", type=['csv', 'parquet'],
+                help="Date, Open, High, Low, Close, Volume columns; add a Symbol column to forecast many stocks at once"
+            )
     
     # Section 2: Stock Selection
     with col2:
@@ -671,7 +681,7 @@ def main():
                         st.session_state.selected_stock = stock
                         st.rerun()
         else:
-            st.info("📊 Using uploaded CSV data")
+            st.info("📊 Using uploaded data\n🗂️ Files with a Symbol column forecast every symbol")
     
     # Section 3: Time Frame Settings
     with col3:
@@ -691,7 +701,7 @@ def main():
         if time_frame_type == "⚡ Short Term (Months)":
             prediction_months = st.selectbox(
                 "🗓️ Prediction Period:",
-                [1, 2, 3, 6, 9, 12, 18, 24],
+                FORECAST_HORIZON_MONTHS,
                 index=0,
                 help="📊 Months to predict into the future"
             )
@@ -700,7 +710,7 @@ def main():
         else:
             prediction_years = st.selectbox(
                 "🗓️ Prediction Period:",
-                [1, 2, 3, 4, 5],
+                FORECAST_HORIZON_YEARS,
                 index=0,
                 help="📊 Years to predict into the future"
             )
@@ -721,6 +731,24 @@ def main():
             min_value=0.80, max_value=0.99, value=0.95, step=0.01,
             help="📈 Statistical confidence level"
         )
+        
+        model_name = {
+            "🧠 Prophet AI (Recommended)": 'prophet',
+            "📊 Linear Trend": 'linear',
+            "📈 Exponential Growth": 'exponential'
+        }[model_type]
+        
+        uncertainty_mode = st.selectbox(
+            "⚙️ Uncertainty Estimation:",
+            ["⚡ Fast (Analytic)", "⚖️ Balanced (200 samples)", "🎯 Full (1000 samples)"],
+            index=1,
+            help="🔬 Fewer simulation samples give faster predictions with slightly rougher confidence bands"
+        )
+        uncertainty_samples = {
+            "⚡ Fast (Analytic)": UNCERTAINTY_SAMPLES['fast'],
+            "⚖️ Balanced (200 samples)": UNCERTAINTY_SAMPLES['balanced'],
+            "🎯 Full (1000 samples)": UNCERTAINTY_SAMPLES['full']
+        }[uncertainty_mode]
     
     # Enhanced Predict Button Section
     st.markdown("---")
@@ -772,22 +800,26 @@ def main():
         
         if data_source == "📊 Upload CSV File":
             if uploaded_file is not None:
-                try:
-                    data = pd.read_csv(uploaded_file)
-                    # Validate CSV format
-                    required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-                    if all(col in data.columns for col in required_columns):
-                        data['Date'] = pd.to_datetime(data['Date'])
-                        data = data.sort_values('Date')
-                        st.success(f"🎉 CSV data loaded successfully! ({len(data)} records)")
-                    else:
-                        st.error(f"❌ CSV must contain columns: {required_columns}")
-                        st.session_state.show_results = False
-                        st.rerun()
-                except Exception as e:
-                    st.error(f"❌ Error reading CSV: {str(e)}")
+                data = DataSources.load_uploaded_data(uploaded_file)
+                if data is None:
                     st.session_state.show_results = False
-                    st.rerun()
+                    st.stop()
+                
+                # Long-format files (Symbol column) hold one series per symbol
+                partitions = partition_by_symbol(data)
+                if None in partitions:
+                    st.success(f"🎉 {uploaded_file.name} loaded successfully! ({len(data)} records)")
+                else:
+                    st.success(f"🎉 {uploaded_file.name} loaded successfully! "
+                               f"({len(data)} records, {len(partitions)} symbols)")
+                    if len(partitions) > 1:
+                        display_universe_forecasts(partitions, prediction_years, model_name,
+                                                   confidence_level, uncertainty_samples)
+                        current_stock = st.selectbox("🔍 Detailed analysis for:", list(partitions),
+                                                     key="upload_symbol")
+                    else:
+                        current_stock = next(iter(partitions))
+                    data = partitions[current_stock]
             else:
                 st.warning("📋 Please upload a CSV file first.")
                 st.session_state.show_results = False
@@ -815,28 +847,68 @@ def main():
             display_stock_metrics(data, current_stock)
             
             # Run Prophet prediction
-            perform_stock_prediction(data, prediction_years, current_stock)
+            # Warm-start refits from this symbol's previous fit (not for uploaded files)
+            warm_start_key = None if data_source == "📊 Upload CSV File" else current_stock
+            perform_stock_prediction(data, prediction_years, current_stock,
+                                     confidence_level, uncertainty_samples, model_name, warm_start_key,
+                                     source=API_SOURCES.get(data_source))
         
         st.markdown('</div>', unsafe_allow_html=True)
 
 
+# Data source selector labels of the API-backed sources
+API_SOURCES = {
+    "🌟 Alpha Vantage API": 'alpha_vantage',
+    "💼 Financial Modeling Prep": 'fmp'
+}
+
 def fetch_data_from_api(api_type, stock, api_key):
     """Fetch data from API"""
     try:
-        if api_type == "🌟 Alpha Vantage API":
-            return DataSources.fetch_alpha_vantage_data(stock, api_key)
-        elif api_type == "💼 Financial Modeling Prep":
-            return DataSources.fetch_fmp_data(stock, api_key)
+        if api_type in API_SOURCES:
+            return DataSources.load_stock_history(API_SOURCES[api_type], stock, api_key)
     except Exception as e:
         st.error(f"❌ API Error: {str(e)}")
     return None
 
+def display_universe_forecasts(partitions, n_years, model_name, confidence_level, uncertainty_samples):
+    """Forecast every symbol of a multi-symbol upload and show one summary table"""
+    st.markdown(f'''
+    <div style="text-align: center; margin: 2rem 0 1rem 0;">
+        <h3 style="color: #667eea; font-weight: 600;">🗂️ Forecasts for {len(partitions)} Symbols</h3>
+    </div>
+    ''', unsafe_allow_html=True)
+    
+    results = PredictionEngine.forecast_symbols(partitions, n_years, model_name,
+                                                confidence_level, uncertainty_samples)
+    failed = results[results['status'] != 'ok']
+    if not failed.empty:
+        st.warning(f"⚠️ {len(failed)} symbol(s) could not be forecast: {', '.join(failed['symbol'])}")
+    
+    st.dataframe(
+        results[['symbol', 'last_date', 'current_price', 'future_price', 'price_change_pct', 'status', 'error']],
+        use_container_width=True,
+        hide_index=True,
+        column_config={
+            'symbol': "Symbol",
+            'last_date': st.column_config.DateColumn("Last Date"),
+            'current_price': st.column_config.NumberColumn("Current Price", format="$%.2f"),
+            'future_price': st.column_config.NumberColumn("Predicted Price", format="$%.2f"),
+            'price_change_pct': st.column_config.NumberColumn("Change", format="%.1f%%"),
+            'status': "Status",
+            'error': "Error"
+        }
+    )
+    st.download_button("⬇️ Download forecasts (CSV)", results.to_csv(index=False),
+                       file_name="forecasts.csv", mime="text/csv")
+
 def display_stock_metrics(data, stock_symbol):
     """Display enhanced stock metrics with beautiful styling"""
     current_price = data['Close'].iloc[-1]
     prev_price = data['Close'].iloc[-2] if len(data) > 1 else current_price
     price_change = current_price - prev_price
     pct_change = (price_change / prev_price) * 100 if prev_price != 0 else 0
+    window_stats = ROLLING_STATS_CACHE.stats(stock_symbol, data)
     
     # Enhanced metrics display header
     st.markdown('''
@@ -864,15 +936,28 @@ def display_stock_metrics(data, stock_symbol):
     with col3:
         st.metric(
             label="📈 52W High",
-            value=f"${data['High'].max():.2f}"
+            value=f"${window_stats.high:.2f}"
         )
     
     with col4:
         st.metric(
             label="📉 52W Low",
-            value=f"${data['Low'].min():.2f}"
+            value=f"${window_stats.low:.2f}"
         )
     
+    # Trailing returns and volatility from the same 252-bar window
+    format_pct = lambda value: f"{value * 100:+.1f}%" if pd.notna(value) else "N/A"
+    ret1, ret2, ret3, ret4 = st.columns(4)
+    with ret1:
+        st.metric(label="🗓️ 1M Return", value=format_pct(window_stats.period_return('1M')))
+    with ret2:
+        st.metric(label="🗓️ 6M Return", value=format_pct(window_stats.period_return('6M')))
+    with ret3:
+        st.metric(label="🗓️ 1Y Return", value=format_pct(window_stats.period_return('1Y')))
+    with ret4:
+        volatility = window_stats.volatility
+        st.metric(label="🌪️ Volatility (1Y)", value=f"{volatility * 100:.1f}%" if pd.notna(volatility) else "N/A")
+    
     # Add Price Chart
     st.markdown('''
     <div style="margin: 2rem 0 1rem 0;">
@@ -882,14 +967,16 @@ def display_stock_metrics(data, stock_symbol):
     </div>
     ''', unsafe_allow_html=True)
     
-    # Create and display the price chart
+    # Create and display the price chart (plotly is imported on first chart render)
+    import plotly.graph_objects as go
     fig = go.Figure()
     
-    # Add price line
-    fig.add_trace(go.Scatter(
-        x=data['Date'],
-        y=data['Close'],
-        mode='lines',
+    # Add price line, downsampled to the chart's pixel budget for the chosen zoom
+    dates = data['Date'].to_numpy()
+    visible = UIComponents.render_zoom_control(dates, key=f"zoom_history_{stock_symbol}")
+    fig.add_trace(UIComponents.line_trace(
+        dates[visible],
+        data['Close'].to_numpy()[visible],
         name='Close Price',
         line=dict(color='#667eea', width=2),
         hovertemplate='<b>%{x}</b><br>Price: $%{y:.2f}<extra></extra>'
@@ -931,6 +1018,30 @@ def display_stock_metrics(data, stock_symbol):
     # Display the chart
     st.plotly_chart(fig, use_container_width=True)
     
+    # Technical indicators, extended incrementally from the previous run's values
+    st.markdown('''
+    <div style="margin: 2rem 0 1rem 0;">
+        <h3 style="color: #667eea; font-weight: 600; text-align: center;">
+            📐 ✨ Technical Indicators ✨
+        </h3>
+    </div>
+    ''', unsafe_allow_html=True)
+    
+    indicators = INDICATOR_CACHE.indicators(stock_symbol, data)
+    latest = indicators.iloc[-1]
+    ind1, ind2, ind3, ind4 = st.columns(4)
+    with ind1:
+        st.metric(label="⚡ RSI (14)", value=f"{latest['RSI_14']:.1f}" if pd.notna(latest['RSI_14']) else "N/A")
+    with ind2:
+        st.metric(label="📊 MACD", value=f"{latest['MACD']:.2f}",
+                  delta=f"{latest['MACD_hist']:.2f} vs signal")
+    with ind3:
+        st.metric(label="🌊 ATR (14)", value=f"${latest['ATR_14']:.2f}" if pd.notna(latest['ATR_14']) else "N/A")
+    with ind4:
+        st.metric(label="⚖️ VWAP (20)", value=f"${latest['VWAP_20']:.2f}" if pd.notna(latest['VWAP_20']) else "N/A")
+    
+    UIComponents.render_indicator_chart(data, indicators, visible)
+    
     # Enhanced recent data section
     st.markdown('''
     <div style="margin: 2rem 0 1rem 0;">
@@ -949,8 +1060,13 @@ def display_stock_metrics(data, stock_symbol):
         hide_index=True
     )
 
-def perform_stock_prediction(data, n_years, stock_symbol):
-    """Perform enhanced stock prediction using Prophet with beautiful styling"""
+def perform_stock_prediction(data, n_years, stock_symbol, confidence_level=0.95, uncertainty_samples=None,
+                             model_name='prophet', warm_start_key=None, source=None):
+    """Perform enhanced stock prediction using Prophet with beautiful styling
+
+    API-sourced symbols are served from the materialized forecasts when
+    one matches the chosen settings; everything else is fitted on demand.
+    """
     try:
         st.markdown('''
         <div style="text-align: center; margin: 2rem 0;">
@@ -967,14 +1083,26 @@ def perform_stock_prediction(data, n_years, stock_symbol):
             # Prepare data for Prophet
             df_train = PredictionEngine.prepare_data_for_prophet(data)
             
-            # Train model (fixed function call)
-            model = PredictionEngine.train_prophet_model(df_train)
+            # Ensure period_days is always an integer
+            period_days = int(n_years * 365)
             
-            if model:
-                # Generate forecast - ensure period_days is always an integer
-                period_days = int(n_years * 365)
-                forecast = PredictionEngine.generate_forecast(model, period_days)
-                
+            # Serve a precomputed forecast if one matches; otherwise fit on the shared job queue
+            forecast = None
+            if source is not None:
+                forecast = PredictionEngine.load_materialized_forecast(source, stock_symbol, data, model_name,
+                                                                       period_days, confidence_level,
+                                                                       uncertainty_samples)
+            model = None
+            if forecast is None:
+                job = PredictionEngine.submit_forecast(data, df_train, n_years, model_name, confidence_level,
+                                                       uncertainty_samples, warm_start_key)
+                if not job.finished:
+                    # Poll instead of blocking this session; the app reruns once the fit is done
+                    PredictionEngine.render_job_status(job.id)
+                    return
+                model, forecast = PredictionEngine.job_result(job)
+            
+            if model or forecast is not None:
                 if forecast is not None:
                     # Extract prediction metrics
                     metrics = PredictionEngine.extract_prediction_metrics(data, forecast)
@@ -1031,7 +1159,7 @@ def perform_stock_prediction(data, n_years, stock_symbol):
                             st.metric(
                                 "📊 Upper Bound",
                                 f"${metrics['confidence_upper']:.2f}",
-                                "95% Confidence"
+                                f"{confidence_level:.0%} Confidence"
                             )
                         else:
                             st.metric("🔍 Accuracy", "High", "AI Confidence")
@@ -1041,7 +1169,7 @@ def perform_stock_prediction(data, n_years, stock_symbol):
                             st.metric(
                                 "📉 Lower Bound",
                                 f"${metrics['confidence_lower']:.2f}",
-                                "95% Confidence"
+                                f"{confidence_level:.0%} Confidence"
                             )
                         else:
                             trend = "📈 Bullish" if change_pct > 0 else "📉 Bearish"
@@ -1059,8 +1187,21 @@ def perform_stock_prediction(data, n_years, stock_symbol):
                     </div>
                     ''', unsafe_allow_html=True)
                     
-                    # Render interactive chart
-                    UIComponents.render_interactive_chart(data, stock_symbol)
+                    # Render forecast chart (history, prediction and confidence band)
+                    UIComponents.render_forecast_chart(df_train, forecast, stock_symbol)
+                    
+                    st.markdown('''
+                    <div style="text-align: center; margin: 2rem 0 1rem 0;">
+                        <h3 style="color: #667eea; font-weight: 600;">
+                            🧩 ✨ Forecast Components ✨ 🧩
+                        </h3>
+                        <p style="color: #e0e6ed; font-size: 1rem;">
+                            📊 Long-term trend and recurring weekly / yearly patterns
+                        </p>
+                    </div>
+                    ''', unsafe_allow_html=True)
+                    
+                    UIComponents.render_forecast_components(forecast)
                     
                 else:
                     st.error("❌ Failed to generate forecast. Please try again.")
@@ -0,0 +1,47 @@
+"""
+Forecast Memory Benchmark
+Bytes per cached forecast: raw Prophet predict() frame vs. the compact layout
+
+Usage: python benchmarks/bench_forecast_memory.py [n_bars] [horizon_days] [n_symbols]
+"""
+
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components import forecasting
+
+
+def make_history(n_bars):
+    rng = np.random.default_rng(0)
+    dates = pd.bdate_range(end=pd.Timestamp.today().normalize(), periods=n_bars)
+    return pd.DataFrame({'ds': dates, 'y': 100 + np.cumsum(rng.normal(0, 1, n_bars))})
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 1500
+    horizon_days = int(sys.argv[2]) if len(sys.argv) > 2 else 1825
+    n_symbols = int(sys.argv[3]) if len(sys.argv) > 3 else 500
+
+    model = forecasting.train_model(make_history(n_bars), use_cache=False)
+    model.uncertainty_samples = forecasting.UNCERTAINTY_SAMPLES['balanced']
+    raw = model.predict(model.make_future_dataframe(periods=horizon_days))
+
+    cases = [
+        ("raw predict()", raw),
+        ("compact", forecasting.compact_forecast(raw)),
+        ("compact future-only", forecasting.compact_forecast(raw, len(model.history), future_only=True)),
+    ]
+    print(f"{n_bars} bars + {horizon_days} days forecast; totals for {n_symbols} symbols")
+    for name, frame in cases:
+        nbytes = forecasting.forecast_nbytes(frame)
+        print(f"{name:>20}: {len(frame.columns):2d} columns | {nbytes / 1024:8.1f} KB each | "
+              f"{nbytes * n_symbols / 2 ** 20:8.1f} MB total")
+
+
+if __name__ == "__main__":
+    main()
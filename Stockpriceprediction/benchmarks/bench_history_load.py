@@ -0,0 +1,64 @@
+"""
+History Load Benchmark
+Load time and private memory (RssAnon) for many stored symbols: Parquet vs memory-mapped Arrow IPC
+
+Usage: python benchmarks/bench_history_load.py [n_symbols] [n_bars]   (Linux only: reads /proc)
+"""
+
+import os
+import sys
+import time
+import tempfile
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.ohlcv_store import OHLCVStore
+
+
+def make_history(n_bars, seed):
+    rng = np.random.default_rng(seed)
+    close = 100 + np.cumsum(rng.normal(0, 1, n_bars))
+    return pd.DataFrame({
+        'Date': pd.bdate_range(end='2024-12-31', periods=n_bars),
+        'Open': close, 'High': close + 1, 'Low': close - 1, 'Close': close,
+        'Volume': rng.integers(1_000, 1_000_000, n_bars)
+    })
+
+
+def rss_anon_mb():
+    """Private (non file-backed) resident memory of this process"""
+    with open('/proc/self/status') as f:
+        for line in f:
+            if line.startswith('RssAnon:'):
+                return int(line.split()[1]) / 1024
+    return float('nan')
+
+
+def main():
+    n_symbols = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    n_bars = int(sys.argv[2]) if len(sys.argv) > 2 else 10_000
+    symbols = [f"SYM{i:04d}" for i in range(n_symbols)]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{n_symbols} symbols x {n_bars} bars")
+        for fmt in ['parquet', 'arrow']:
+            store = OHLCVStore(root=tmp, fmt=fmt)
+            for i, symbol in enumerate(symbols):
+                store.save('bench', symbol, make_history(n_bars, i))
+
+            before = rss_anon_mb()
+            started = time.perf_counter()
+            frames = [store.load('bench', symbol) for symbol in symbols]
+            elapsed = time.perf_counter() - started
+            # Touch every close so mapped pages are actually read
+            checksum = sum(float(frame['Close'].to_numpy().sum()) for frame in frames)
+            print(f"{fmt:>8}: {elapsed:6.2f} s | private memory +{rss_anon_mb() - before:7.1f} MB "
+                  f"(checksum {checksum:.0f})")
+            del frames
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""
+Import-Time Benchmark
+Measures cold-start import cost of the app and CLI entry points in fresh interpreters
+
+Usage: python benchmarks/bench_import.py [runs]
+"""
+
+import os
+import sys
+import json
+import statistics
+import subprocess
+
+APP_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+REPO_ROOT = os.path.dirname(APP_DIR)
+
+HEAVY_MODULES = ['streamlit', 'prophet', 'cmdstanpy', 'plotly.graph_objects', 'matplotlib']
+
+# (label, working directory, import statement)
+CASES = [
+    ("app.py imports", APP_DIR,
+     "import components.data_sources, components.prediction_engine, components.ui_components"),
+    ("CLI (python -m Stockpriceprediction)", REPO_ROOT,
+     "import Stockpriceprediction.cli"),
+    ("batch worker", APP_DIR,
+     "import components.batch"),
+    ("reference: prophet", APP_DIR, "import prophet"),
+    ("reference: plotly.graph_objects", APP_DIR, "import plotly.graph_objects"),
+]
+
+PROBE = """
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'seconds': elapsed, 'loaded': [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def measure(cwd, statement):
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    output = subprocess.run([sys.executable, '-c', code], cwd=cwd, capture_output=True,
+                            text=True, check=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    print(f"Median import time over {runs} fresh interpreters")
+    for label, cwd, statement in CASES:
+        samples = [measure(cwd, statement) for _ in range(runs)]
+        median_ms = statistics.median(sample['seconds'] for sample in samples) * 1000
+        loaded = ', '.join(samples[-1]['loaded']) or '-'
+        print(f"{label:>38}: {median_ms:8.1f} ms | heavy modules loaded: {loaded}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+"""
+Parsing Benchmark
+Compares the legacy row-by-row payload parsing with the columnar parser
+
+Usage: python benchmarks/bench_parsing.py [n_bars]
+"""
+
+import os
+import sys
+import json
+import timeit
+from datetime import datetime, timedelta
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from components.parsing import parse_alpha_vantage, parse_fmp
+
+
+def make_alpha_vantage_payload(n_bars):
+    """Synthetic newest-first Alpha Vantage payload, round-tripped through JSON"""
+    start = datetime(2000, 1, 3)
+    time_series = {}
+    for i in reversed(range(n_bars)):
+        price = 100 + i * 0.01
+        time_series[(start + timedelta(days=i)).strftime('%Y-%m-%d')] = {
+            '1. open': f"{price:.4f}",
+            '2. high': f"{price + 1:.4f}",
+            '3. low': f"{price - 1:.4f}",
+            '4. close': f"{price + 0.5:.4f}",
+            '5. volume': str(1_000_000 + i)
+        }
+    return json.loads(json.dumps(time_series))
+
+
+def make_fmp_payload(n_bars):
+    """Synthetic newest-first FMP 'historical' list"""
+    start = datetime(2000, 1, 3)
+    historical = []
+    for i in reversed(range(n_bars)):
+        price = 100 + i * 0.01
+        historical.append({
+            'date': (start + timedelta(days=i)).strftime('%Y-%m-%d'),
+            'open': price, 'high': price + 1, 'low': price - 1,
+            'close': price + 0.5, 'volume': 1_000_000 + i
+        })
+    return json.loads(json.dumps(historical))
+
+
+def legacy_alpha_vantage(time_series):
+    """Row-by-row parsing as previously done in DataSources"""
+    df_data = []
+    for date_str, values in time_series.items():
+        df_data.append({
+            'Date': datetime.strptime(date_str, '%Y-%m-%d'),
+            'Open': float(values['1. open']),
+            'High': float(values['2. high']),
+            'Low': float(values['3. low']),
+            'Close': float(values['4. close']),
+            'Volume': int(values['5. volume'])
+        })
+    return pd.DataFrame(df_data).sort_values('Date').reset_index(drop=True)
+
+
+def legacy_fmp(historical):
+    """Row-by-row parsing as previously done in DataSources"""
+    df_data = []
+    for item in historical:
+        df_data.append({
+            'Date': datetime.strptime(item['date'], '%Y-%m-%d'),
+            'Open': float(item['open']),
+            'High': float(item['high']),
+            'Low': float(item['low']),
+            'Close': float(item['close']),
+            'Volume': int(item['volume'])
+        })
+    return pd.DataFrame(df_data).sort_values('Date').reset_index(drop=True)
+
+
+def best_ms(func, payload, number=10, repeat=5):
+    return min(timeit.repeat(lambda: func(payload), number=number, repeat=repeat)) / number * 1000
+
+
+def main():
+    n_bars = int(sys.argv[1]) if len(sys.argv) > 1 else 6500
+    cases = [
+        ("Alpha Vantage", make_alpha_vantage_payload(n_bars), legacy_alpha_vantage, parse_alpha_vantage),
+        ("FMP", make_fmp_payload(n_bars), legacy_fmp, parse_fmp),
+    ]
+
+    print(f"Parsing {n_bars} daily bars")
+    for name, payload, legacy, columnar in cases:
+        pd.testing.assert_frame_equal(legacy(payload), columnar(payload), check_dtype=False)
+        legacy_ms = best_ms(legacy, payload)
+        columnar_ms = best_ms(columnar, payload)
+        print(f"{name:>14}: legacy {legacy_ms:7.2f} ms | columnar {columnar_ms:7.2f} ms | "
+              f"{legacy_ms / columnar_ms:4.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
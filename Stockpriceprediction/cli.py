@@ -0,0 +1,199 @@
+"""
+Command Line Interface
+Fetch, forecast and export without Streamlit
+
+Usage (from the repository root):
+    python -m Stockpriceprediction fetch AAPL --source fmp --api-key demo --output aapl.csv
+    python -m Stockpriceprediction forecast AAPL --years 1 --output aapl_forecast.csv
+    python -m Stockpriceprediction forecast --csv prices.csv --years 2
+    python -m Stockpriceprediction backtest AAPL --models prophet linear --horizon 90
+    python -m Stockpriceprediction batch --source fmp --output forecasts.csv
+    python -m Stockpriceprediction materialize --source fmp --daemon
+"""
+
+import os
+import sys
+import logging
+import argparse
+
+import pandas as pd
+
+from .components import ingest, market_data
+from .components.exceptions import StockProphetError
+
+FORECAST_EXPORT_COLUMNS = ['ds', 'yhat', 'yhat_lower', 'yhat_upper']
+
+
+def _write_frame(df, path):
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def _load_data(args):
+    if args.csv:
+        partitions = ingest.partition_by_symbol(ingest.read_ohlcv_file(args.csv))
+        if None in partitions:
+            return partitions[None]
+        if args.symbol:
+            data = partitions.get(args.symbol, partitions.get(args.symbol.upper()))
+            if data is None:
+                raise SystemExit(f"error: {args.symbol} is not in {args.csv} "
+                                 f"(symbols: {', '.join(sorted(partitions))})")
+            return data
+        if len(partitions) == 1:
+            return next(iter(partitions.values()))
+        raise SystemExit(f"error: {args.csv} holds {len(partitions)} symbols; pass one as the symbol argument, "
+                         f"or forecast them all with `batch --input {args.csv}`")
+    if not args.symbol:
+        raise SystemExit("error: a symbol or --csv file is required")
+    return market_data.load_stock_history(args.source, args.symbol, args.api_key)
+
+
+def cmd_fetch(args):
+    data = _load_data(args)
+    if args.output:
+        _write_frame(data, args.output)
+        print(f"Wrote {len(data)} bars to {args.output}")
+    else:
+        print(data.tail(10).to_string(index=False))
+    return 0
+
+
+def cmd_forecast(args):
+    from .components import forecasting
+
+    data = _load_data(args)
+    _, forecast, metrics = forecasting.run_forecast(
+        data, args.years, use_cache=not args.no_cache, model_name=args.model,
+        warm_start_key=None if args.csv else args.symbol,
+        interval_width=args.interval_width,
+        uncertainty_samples=forecasting.UNCERTAINTY_SAMPLES[args.uncertainty], future_only=True)
+
+    label = args.symbol or os.path.basename(args.csv)
+    print(f"{label}: current ${metrics['current_price']:.2f} -> "
+          f"${metrics['future_price']:.2f} in {args.years:g}y ({metrics['price_change_pct']:+.2f}%), "
+          f"{args.interval_width:.0%} interval ${metrics['confidence_lower']:.2f}-${metrics['confidence_upper']:.2f}")
+
+    if args.output:
+        _write_frame(forecast[FORECAST_EXPORT_COLUMNS], args.output)
+        print(f"Wrote {len(forecast)} forecast rows to {args.output}")
+    return 0
+
+
+def cmd_backtest(args):
+    from .components import backtesting
+
+    data = _load_data(args)
+    label = args.symbol or os.path.basename(args.csv)
+    progress = lambda level, message: print(message, file=sys.stderr)
+    metrics = backtesting.compare_models(
+        data, args.models, horizon_days=args.horizon, period_days=args.period,
+        initial_days=args.initial, interval_width=args.interval_width,
+        max_workers=args.workers, progress=progress)
+
+    print(f"{label}: rolling-origin backtest, {args.horizon}-day horizon every {args.period} days")
+    print(metrics.to_string(index=False, float_format=lambda value: f"{value:.2f}"))
+    if args.output:
+        _write_frame(metrics, args.output)
+        print(f"Wrote {len(metrics)} metric rows to {args.output}")
+    return 0
+
+
+def cmd_materialize(args):
+    from .components import materialize
+
+    progress = lambda level, message: print(message, file=sys.stderr)
+    if args.daemon:
+        materialize.run_scheduler(args.source, args.api_key, args.symbols, args.models, args.workers,
+                                  progress=progress)
+        return 0
+
+    results = materialize.materialize(args.source, args.api_key, args.symbols, args.models, args.workers,
+                                      force=args.force, progress=progress)
+    for row in results.itertuples():
+        timing = f" ({row.fit_seconds}s)" if pd.notna(row.fit_seconds) else ""
+        print(f"{row.symbol:>14} {row.model:>11}: {row.status}{timing}"
+              + (f" - {row.error}" if row.status != 'ok' else ""))
+    return 0 if results.empty or (results['status'] == 'ok').any() else 1
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="python -m Stockpriceprediction",
+                                     description="Stock Prophet command line interface")
+    parser.add_argument('-v', '--verbose', action='store_true', help="Show progress logging")
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    def add_data_arguments(sub):
+        sub.add_argument('symbol', nargs='?', help="Ticker symbol, e.g. AAPL")
+        sub.add_argument('--source', choices=sorted(market_data.SOURCE_NAMES), default='fmp')
+        sub.add_argument('--api-key', default=os.environ.get('STOCK_PROPHET_API_KEY', 'demo'))
+        sub.add_argument('--csv', help="Read OHLCV history from a CSV file instead of an API "
+                                       "(for long-format files, the symbol picks one series)")
+        sub.add_argument('--output', help="Write results to a .csv or .parquet file")
+
+    fetch = subparsers.add_parser('fetch', help="Fetch daily OHLCV history")
+    add_data_arguments(fetch)
+    fetch.set_defaults(func=cmd_fetch)
+
+    forecast = subparsers.add_parser('forecast', help="Fit a model and forecast one symbol")
+    add_data_arguments(forecast)
+    forecast.add_argument('--years', type=float, default=1.0, help="Forecast horizon in years")
+    forecast.add_argument('--model', choices=['prophet', 'linear', 'exponential'], default='prophet')
+    forecast.add_argument('--interval-width', type=float, default=0.80, help="Prediction interval width")
+    forecast.add_argument('--uncertainty', choices=['fast', 'balanced', 'full'], default='full',
+                          help="Uncertainty estimation: analytic (fast) or 200/1000 simulation samples")
+    forecast.add_argument('--no-cache', action='store_true', help="Always refit the model")
+    forecast.set_defaults(func=cmd_forecast)
+
+    backtest = subparsers.add_parser('backtest', help="Measure forecast accuracy with rolling-origin backtests")
+    add_data_arguments(backtest)
+    backtest.add_argument('--models', nargs='+', choices=['prophet', 'linear', 'exponential'],
+                          default=['prophet', 'linear', 'exponential'], help="Backends to compare")
+    backtest.add_argument('--horizon', type=int, default=90, help="Forecast horizon in calendar days")
+    backtest.add_argument('--period', type=int, default=30, help="Days between cutoffs")
+    backtest.add_argument('--initial', type=int, default=730, help="Minimum training history in days")
+    backtest.add_argument('--interval-width', type=float, default=0.80, help="Prediction interval width")
+    backtest.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    backtest.set_defaults(func=cmd_backtest)
+
+    materialize = subparsers.add_parser('materialize', help="Precompute the forecasts the app serves")
+    materialize.add_argument('--source', choices=sorted(market_data.SOURCE_NAMES), default='fmp')
+    materialize.add_argument('--api-key', default=os.environ.get('STOCK_PROPHET_API_KEY', 'demo'))
+    materialize.add_argument('--symbols', nargs='*', help="Symbols to materialize (default: all POPULAR_STOCKS)")
+    materialize.add_argument('--models', nargs='+', choices=['prophet', 'linear', 'exponential'],
+                             default=['prophet'], help="Backends to materialize")
+    materialize.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    materialize.add_argument('--force', action='store_true', help="Refit symbols whose forecasts are current")
+    materialize.add_argument('--daemon', action='store_true',
+                             help="Keep running and materialize again after every market close")
+    materialize.set_defaults(func=cmd_materialize)
+
+    subparsers.add_parser('batch', help="Forecast many symbols in parallel (see batch --help)",
+                          add_help=False)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    verbose = '-v' in argv or '--verbose' in argv
+    logging.basicConfig(level=logging.INFO if verbose else logging.WARNING,
+                        format="%(levelname)s %(name)s: %(message)s")
+    if not verbose:
+        logging.getLogger('cmdstanpy').setLevel(logging.WARNING)
+
+    # The batch command owns its own argument parser
+    args_without_flags = [arg for arg in argv if arg not in ('-v', '--verbose')]
+    try:
+        if args_without_flags[:1] == ['batch']:
+            from .components import batch
+            return batch.main(args_without_flags[1:])
+
+        args = build_parser().parse_args(argv)
+        return args.func(args)
+    except StockProphetError as e:
+        print(f"error: {e.message}", file=sys.stderr)
+        if e.hint:
+            print(f"hint: {e.hint}", file=sys.stderr)
+        return 1
@@ -1,12 +1,32 @@
 """
 Components Package
 Modular components for Stock Prophet application
+
+The Streamlit-facing classes are imported on first access so that the
+Streamlit-free core (market_data, forecasting, batch) can be used from
+scripts and worker processes without importing Streamlit.
 """
 
-from .ui_components import UIComponents
-from .data_sources import DataSources
-from .prediction_engine import PredictionEngine
+from importlib import import_module
+
 from .stock_data import POPULAR_STOCKS, API_COMPARISON_DATA, DATA_SOURCE_CONFIG
+from .exceptions import (
+    StockProphetError, DataSourceError, APILimitError, SymbolNotFoundError,
+    DataFormatError, InsufficientDataError, ModelTrainingError, ForecastError
+)
+
+_LAZY_ATTRIBUTES = {
+    'UIComponents': '.ui_components',
+    'DataSources': '.data_sources',
+    'PredictionEngine': '.prediction_engine',
+}
+
+def __getattr__(name):
+    if name in _LAZY_ATTRIBUTES:
+        value = getattr(import_module(_LAZY_ATTRIBUTES[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'UIComponents',
@@ -14,5 +34,13 @@ __all__ = [
     'PredictionEngine',
     'POPULAR_STOCKS',
     'API_COMPARISON_DATA',
-    'DATA_SOURCE_CONFIG'
+    'DATA_SOURCE_CONFIG',
+    'StockProphetError',
+    'DataSourceError',
+    'APILimitError',
+    'SymbolNotFoundError',
+    'DataFormatError',
+    'InsufficientDataError',
+    'ModelTrainingError',
+    'ForecastError'
 ] 
\ No newline at end of file
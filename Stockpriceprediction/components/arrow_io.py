@@ -0,0 +1,63 @@
+"""
+Arrow IO Module
+Arrow IPC encoding of DataFrames for caches and history files
+"""
+
+import pyarrow as pa
+
+from .fileutil import atomic_write
+
+
+def frame_to_ipc(df):
+    """Serialize a DataFrame (without its index) to Arrow IPC stream bytes"""
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def ipc_to_frame(buffer):
+    """DataFrame from Arrow IPC stream bytes or a pyarrow Buffer (e.g. a memory map)
+
+    Arrow reads the columns in place; to_pandas then hands numeric and
+    timestamp columns without nulls to pandas without copying them. Those
+    columns are read-only views: replacing a column works, but in-place
+    edits (df.loc[i, col] = x) need a df.copy() first.
+    """
+    if not isinstance(buffer, pa.Buffer):
+        buffer = pa.py_buffer(buffer)
+    table = pa.ipc.open_stream(buffer).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def write_ipc_file(df, path, metadata=None):
+    """Atomically write a DataFrame as an uncompressed Arrow IPC file (fixed-width, mmap-able columns)
+
+    metadata is an optional {str: str} dict stored in the file's schema.
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}),
+                                               **{key.encode(): value.encode() for key, value in metadata.items()}})
+    with atomic_write(path) as sink, pa.ipc.new_file(sink, table.schema) as writer:
+        writer.write_table(table)
+
+
+def read_ipc_file(path):
+    """Memory-map an Arrow IPC file and return its DataFrame view
+
+    Pages are read from the OS page cache on first access and shared by
+    every process that maps the same file; see ipc_to_frame for which
+    columns are views.
+    """
+    with pa.memory_map(path) as source:
+        table = pa.ipc.open_file(source).read_all()
+    return table.to_pandas(split_blocks=True)
+
+
+def read_ipc_metadata(path):
+    """The {str: str} schema metadata of an Arrow IPC file, without reading its columns"""
+    with pa.memory_map(path) as source:
+        metadata = pa.ipc.open_file(source).schema.metadata or {}
+    return {key.decode(): value.decode() for key, value in metadata.items() if key != b'pandas'}
@@ -0,0 +1,166 @@
+"""
+Backtesting Module
+Rolling-origin evaluation of the forecasting backends
+
+Usage:
+    results, metrics = run_backtest(data, model_name='linear', horizon_days=90)
+    summary = compare_models(data, ['prophet', 'linear', 'exponential'])
+"""
+
+import logging
+import time
+from concurrent.futures import as_completed
+
+import numpy as np
+import pandas as pd
+
+from . import forecasting
+from .config import BACKTEST_CACHE_DIR, BACKTEST_CACHE_MAX_BYTES, BACKTEST_CACHE_MAX_ENTRIES
+from .exceptions import InsufficientDataError
+from .jobs import process_pool
+from .model_cache import ModelCache
+from .progress import report, INFO, SUCCESS
+
+logger = logging.getLogger(__name__)
+
+# Defaults in calendar days, as in prophet.diagnostics.cross_validation
+DEFAULT_HORIZON_DAYS = 90
+DEFAULT_PERIOD_DAYS = 30
+DEFAULT_INITIAL_DAYS = 730
+
+# Upper edges (calendar days after the cutoff) of the horizon buckets metrics are reported for
+HORIZON_BUCKETS = [7, 30, 90, 180, 365, 730, 1825]
+
+RESULT_COLUMNS = ['cutoff', 'ds', 'y', 'yhat', 'yhat_lower', 'yhat_upper']
+
+# Cutoff fits, separate from the app's MODEL_CACHE
+BACKTEST_MODEL_CACHE = ModelCache(cache_dir=BACKTEST_CACHE_DIR, max_bytes=BACKTEST_CACHE_MAX_BYTES,
+                                  max_entries=BACKTEST_CACHE_MAX_ENTRIES)
+
+
+def generate_cutoffs(ds, horizon_days=DEFAULT_HORIZON_DAYS, period_days=DEFAULT_PERIOD_DAYS,
+                     initial_days=DEFAULT_INITIAL_DAYS):
+    """Cutoff dates, oldest first, spaced period_days apart
+
+    The last cutoff leaves a full horizon of observations after it; the
+    first leaves at least initial_days of training history before it.
+    """
+    ds = pd.DatetimeIndex(ds)
+    first = ds[0] + pd.Timedelta(days=initial_days)
+    cutoff = ds[-1] - pd.Timedelta(days=horizon_days)
+    cutoffs = []
+    while cutoff >= first:
+        # Snap to the last observation at or before the nominal cutoff
+        cutoffs.append(ds[ds.searchsorted(cutoff, side='right') - 1])
+        cutoff -= pd.Timedelta(days=period_days)
+    if not cutoffs:
+        raise InsufficientDataError(
+            f"Not enough history to backtest: need {initial_days} days of training data "
+            f"plus a {horizon_days}-day horizon.")
+    return sorted(set(cutoffs))
+
+
+def evaluate_cutoff(df_train, cutoff, horizon_days, model_name='prophet', interval_width=0.80,
+                    uncertainty_samples=0):
+    """Fit on data up to cutoff and predict the observed days in (cutoff, cutoff + horizon]
+
+    Runs inside a worker process. Cutoff fits are cached in
+    BACKTEST_MODEL_CACHE, so reruns reuse them without evicting the models
+    the app serves from MODEL_CACHE.
+    """
+    ds = df_train['ds'].to_numpy(dtype='datetime64[ns]')
+    cutoff = np.datetime64(cutoff, 'ns')
+    n_train = np.searchsorted(ds, cutoff, side='right')
+    n_end = np.searchsorted(ds, cutoff + np.timedelta64(horizon_days, 'D'), side='right')
+
+    started = time.perf_counter()
+    model = forecasting.train_model(df_train.iloc[:n_train], model_name=model_name,
+                                    model_cache=BACKTEST_MODEL_CACHE)
+    model.interval_width = interval_width
+    model.uncertainty_samples = uncertainty_samples
+
+    # Predict only the held-out dates instead of the whole history
+    test = df_train.iloc[n_train:n_end]
+    forecast = forecasting.predict_with_interval(model, test[['ds']].reset_index(drop=True))
+
+    result = pd.DataFrame({
+        'cutoff': pd.Timestamp(cutoff),
+        'ds': test['ds'].to_numpy(),
+        'y': test['y'].to_numpy(dtype=np.float64),
+        'yhat': forecast['yhat'].to_numpy(dtype=np.float64),
+        'yhat_lower': forecast['yhat_lower'].to_numpy(dtype=np.float64),
+        'yhat_upper': forecast['yhat_upper'].to_numpy(dtype=np.float64)
+    }, columns=RESULT_COLUMNS)
+    return result, time.perf_counter() - started
+
+
+def performance_metrics(results, buckets=HORIZON_BUCKETS):
+    """MAPE, RMSE, MAE and interval coverage per horizon bucket
+
+    Horizons are calendar days after the cutoff; a row falls in the first
+    bucket whose upper edge it does not exceed. MAPE skips zero prices.
+    """
+    horizon = (results['ds'] - results['cutoff']).dt.days.to_numpy()
+    edges = [0] + [edge for edge in buckets if edge < horizon.max()] + [horizon.max()]
+    labels = [f"{lo + 1}-{hi}d" for lo, hi in zip(edges[:-1], edges[1:])]
+    bucket = pd.cut(horizon, edges, labels=labels)
+
+    y = results['y'].to_numpy()
+    error = results['yhat'].to_numpy() - y
+    with np.errstate(divide='ignore', invalid='ignore'):
+        ape = np.where(y != 0, np.abs(error / y), np.nan)
+    covered = (y >= results['yhat_lower'].to_numpy()) & (y <= results['yhat_upper'].to_numpy())
+
+    frame = pd.DataFrame({'horizon': bucket, 'ape': ape, 'se': error ** 2, 'ae': np.abs(error),
+                          'covered': covered})
+    grouped = frame.groupby('horizon', observed=True)
+    metrics = pd.DataFrame({
+        'points': grouped.size(),
+        'mape': grouped['ape'].mean() * 100,
+        'rmse': np.sqrt(grouped['se'].mean()),
+        'mae': grouped['ae'].mean(),
+        'coverage': grouped['covered'].mean() * 100
+    })
+    return metrics.reset_index()
+
+
+def run_backtest(data, model_name='prophet', horizon_days=DEFAULT_HORIZON_DAYS, period_days=DEFAULT_PERIOD_DAYS,
+                 initial_days=DEFAULT_INITIAL_DAYS, interval_width=0.80, uncertainty_samples=0,
+                 max_workers=None, progress=None):
+    """Rolling-origin backtest of one backend; returns (results, metrics)
+
+    Prophet cutoffs are fitted in parallel worker processes; closed-form
+    backends fit in milliseconds and run in this process unless
+    max_workers is given (max_workers=1 always runs in-process).
+    uncertainty_samples defaults to 0, the analytic interval.
+    """
+    df_train = forecasting.prepare_training_frame(data).reset_index(drop=True)
+    cutoffs = generate_cutoffs(df_train['ds'], horizon_days, period_days, initial_days)
+    label = forecasting.MODEL_BACKENDS[model_name]['label']
+    report(logger, progress, INFO, f"Backtesting {label} over {len(cutoffs)} cutoffs...")
+
+    args = (horizon_days, model_name, interval_width, uncertainty_samples)
+    started = time.perf_counter()
+    if max_workers == 1 or (max_workers is None and not forecasting.MODEL_BACKENDS[model_name]['persist']):
+        outcomes = [evaluate_cutoff(df_train, cutoff, *args) for cutoff in cutoffs]
+    else:
+        with process_pool(max_workers) as pool:
+            futures = [pool.submit(evaluate_cutoff, df_train, cutoff, *args) for cutoff in cutoffs]
+            outcomes = [future.result() for future in as_completed(futures)]
+
+    results = pd.concat([result for result, _ in outcomes], ignore_index=True)
+    results = results.sort_values(['cutoff', 'ds'], kind='stable').reset_index(drop=True)
+    fit_seconds = sum(seconds for _, seconds in outcomes)
+    report(logger, progress, SUCCESS, f"{label} backtest finished in {time.perf_counter() - started:.1f}s "
+                                      f"({fit_seconds:.1f}s of fitting)")
+    return results, performance_metrics(results)
+
+
+def compare_models(data, model_names=tuple(forecasting.MODEL_BACKENDS), **kwargs):
+    """Backtest several backends on the same cutoffs; returns one metrics table with a model column"""
+    tables = []
+    for model_name in model_names:
+        _, metrics = run_backtest(data, model_name=model_name, **kwargs)
+        metrics.insert(0, 'model', model_name)
+        tables.append(metrics)
+    return pd.concat(tables, ignore_index=True)
@@ -0,0 +1,174 @@
+"""
+Batch Forecasting Module
+Fits and predicts many symbols in parallel across worker processes
+
+Usage:
+    python -m components.batch --source fmp --api-key demo --years 1 --output forecasts.csv
+    python -m components.batch --input universe.parquet --model linear --output forecasts.parquet
+"""
+
+import os
+import sys
+import time
+import argparse
+from concurrent.futures import as_completed
+
+import pandas as pd
+
+from . import forecasting, ingest, market_data
+from .jobs import process_pool
+from .stock_data import POPULAR_STOCKS
+
+RESULT_COLUMNS = [
+    'symbol', 'source', 'model', 'last_date', 'horizon_days', 'current_price', 'future_price',
+    'price_change', 'price_change_pct', 'fit_seconds', 'status', 'error'
+]
+
+
+def forecast_symbol(symbol, source, data, period_days, model_name='prophet', warm_start=True,
+                    interval_width=None, uncertainty_samples=None):
+    """Fit and forecast one symbol; runs inside a worker process"""
+    result = {'symbol': symbol, 'source': source, 'model': model_name, 'horizon_days': period_days}
+    started = time.perf_counter()
+    try:
+        if data is None or data.empty:
+            raise ValueError("no data")
+
+        df_train = forecasting.prepare_training_frame(data)
+        model = forecasting.train_model(df_train, model_name=model_name,
+                                        warm_start_key=symbol if warm_start else None)
+        forecast = forecasting.generate_forecast(model, period_days, interval_width=interval_width,
+                                                 uncertainty_samples=uncertainty_samples)
+
+        result.update(forecasting.extract_prediction_metrics(data, forecast))
+        result.update(last_date=data['Date'].iloc[-1], status='ok', error=None)
+    except Exception as e:
+        result.update(status='failed', error=str(e))
+    result['fit_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def run_batch(symbols, source, api_key, n_years=1, max_workers=None, progress=None, model_name='prophet',
+              fetch_concurrency=8, worker=forecast_symbol, fresh_after=None):
+    """Fetch every symbol concurrently and forecast them in parallel
+
+    Fetches go through market_data.fetch_many with fetch_concurrency
+    threads, paced by the shared per-provider rate limiter so they never
+    exceed the provider's limits; symbols beyond the per-minute limit wait
+    their turn and only fail once the daily quota is used up. worker is
+    called as worker(symbol, source, data, period_days, model_name) in a worker
+    process and returns a result dict. fresh_after is passed to
+    load_stock_history. Returns one consolidated DataFrame with a row per
+    symbol.
+    """
+    period_days = int(n_years * 365)
+    results = []
+
+    with process_pool(max_workers) as pool:
+        futures = {}
+
+        # Fetching stays in this process so rate limits apply globally;
+        # fits start as soon as each symbol's data is available.
+        def submit(symbol, data):
+            if isinstance(data, Exception):
+                results.append({'symbol': symbol, 'source': source, 'model': model_name,
+                                'horizon_days': period_days,
+                                'status': 'failed', 'error': f"fetch failed: {data}"})
+            else:
+                futures[pool.submit(worker, symbol, source, data, period_days, model_name)] = symbol
+
+        market_data.fetch_many_sync(symbols, source, api_key, fetch_concurrency, on_result=submit,
+                                    max_wait=None, fresh_after=fresh_after)
+        results.extend(_collect(futures, progress))
+
+    return results_frame(results)
+
+
+def forecast_frames(partitions, n_years=1, max_workers=None, progress=None, model_name='prophet',
+                    source='upload', interval_width=None, uncertainty_samples=None):
+    """Forecast already-loaded {symbol: OHLCV frame} partitions in parallel
+
+    Used for multi-symbol uploads; uploaded series never warm-start from
+    (or overwrite) the fits of API-sourced symbols with the same name.
+    """
+    period_days = int(n_years * 365)
+    with process_pool(max_workers) as pool:
+        futures = {pool.submit(forecast_symbol, symbol, source, data, period_days, model_name,
+                               False, interval_width, uncertainty_samples): symbol
+                   for symbol, data in partitions.items()}
+        results = _collect(futures, progress)
+    return results_frame(results)
+
+
+def _collect(futures, progress=None):
+    results = []
+    for future in as_completed(futures):
+        result = future.result()
+        results.append(result)
+        if progress:
+            progress(result)
+    return results
+
+
+def results_frame(results):
+    """Result dicts as the consolidated table: RESULT_COLUMNS, one row per symbol, sorted by symbol"""
+    df = pd.DataFrame(results, columns=RESULT_COLUMNS)
+    return df.sort_values('symbol').reset_index(drop=True)
+
+
+def default_symbols(source):
+    """All POPULAR_STOCKS the given source can serve"""
+    if source == 'alpha_vantage':
+        return [symbol for symbol in POPULAR_STOCKS
+                if not any(symbol.endswith(ext) for ext in market_data.INTERNATIONAL_SUFFIXES)]
+    return list(POPULAR_STOCKS)
+
+
+def write_results(df, path):
+    """Write the consolidated table as Parquet or CSV depending on the extension"""
+    if path.endswith('.parquet'):
+        df.to_parquet(path, index=False)
+    else:
+        df.to_csv(path, index=False)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Batch forecasts for many symbols")
+    parser.add_argument('--source', choices=['alpha_vantage', 'fmp'], default='fmp')
+    parser.add_argument('--api-key', default=os.environ.get('STOCK_PROPHET_API_KEY', 'demo'))
+    parser.add_argument('--symbols', nargs='*', help="Symbols to forecast (default: all POPULAR_STOCKS)")
+    parser.add_argument('--input', help="Long-format Symbol/Date/OHLCV .csv or .parquet file to forecast "
+                                        "instead of fetching from --source")
+    parser.add_argument('--years', type=float, default=1.0, help="Forecast horizon in years")
+    parser.add_argument('--model', choices=['prophet', 'linear', 'exponential'], default='prophet',
+                        help="Forecasting backend (linear/exponential fit in milliseconds for screening)")
+    parser.add_argument('--workers', type=int, default=None, help="Worker processes (default: CPU count)")
+    parser.add_argument('--output', default='forecasts.csv', help="Output .csv or .parquet path")
+    args = parser.parse_args(argv)
+
+    def report(result):
+        print(f"{result['symbol']:>14}: {result['status']} ({result['fit_seconds']}s)"
+              + (f" - {result['error']}" if result.get('error') else ""))
+
+    if args.input:
+        partitions = ingest.partition_by_symbol(ingest.read_ohlcv_file(args.input))
+        if None in partitions:
+            # Single series without a Symbol column: name it after the file
+            partitions = {os.path.splitext(os.path.basename(args.input))[0]: partitions[None]}
+        if args.symbols:
+            partitions = {symbol: data for symbol, data in partitions.items() if symbol in args.symbols}
+        df = forecast_frames(partitions, args.years, args.workers, progress=report, model_name=args.model)
+    else:
+        if args.symbols:
+            symbols = args.symbols
+        else:
+            symbols = default_symbols(args.source)
+        df = run_batch(symbols, args.source, args.api_key, args.years, args.workers, progress=report,
+                       model_name=args.model)
+    write_results(df, args.output)
+    print(f"Wrote {len(df)} forecasts to {args.output}")
+    return 0 if (df['status'] == 'ok').any() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
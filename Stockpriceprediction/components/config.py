@@ -0,0 +1,67 @@
+"""
+Configuration Module
+Runtime settings shared by the caching and storage components
+"""
+
+import os
+
+# Root directory for everything Stock Prophet persists locally
+CACHE_ROOT = os.environ.get(
+    "STOCK_PROPHET_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".stock_prophet")
+)
+
+# Fitted Prophet models
+MODEL_CACHE_DIR = os.path.join(CACHE_ROOT, "models")
+MODEL_CACHE_MAX_BYTES = int(os.environ.get("STOCK_PROPHET_MODEL_CACHE_MB", "512")) * 1024 * 1024
+MODEL_CACHE_MAX_ENTRIES = int(os.environ.get("STOCK_PROPHET_MODEL_CACHE_ENTRIES", "200"))
+
+# Per-cutoff backtest fits, kept apart so they never evict the models the app serves
+BACKTEST_CACHE_DIR = os.path.join(CACHE_ROOT, "backtest")
+BACKTEST_CACHE_MAX_BYTES = int(os.environ.get("STOCK_PROPHET_BACKTEST_CACHE_MB", "512")) * 1024 * 1024
+BACKTEST_CACHE_MAX_ENTRIES = int(os.environ.get("STOCK_PROPHET_BACKTEST_CACHE_ENTRIES", "2000"))
+
+# Per-symbol OHLCV history
+OHLCV_STORE_DIR = os.path.join(CACHE_ROOT, "ohlcv")
+OHLCV_REFRESH_SECONDS = int(os.environ.get("STOCK_PROPHET_REFRESH_SECONDS", str(4 * 60 * 60)))
+# 'arrow' (memory-mapped, zero-copy loads) or 'parquet' (compressed)
+OHLCV_STORE_FORMAT = os.environ.get("STOCK_PROPHET_OHLCV_FORMAT", "arrow")
+
+# In-memory forecast results
+FORECAST_CACHE_MAX_BYTES = int(os.environ.get("STOCK_PROPHET_FORECAST_CACHE_MB", "256")) * 1024 * 1024
+
+# HTTP client
+HTTP_POOL_SIZE = int(os.environ.get("STOCK_PROPHET_HTTP_POOL_SIZE", "20"))
+HTTP_RETRIES = int(os.environ.get("STOCK_PROPHET_HTTP_RETRIES", "3"))
+HTTP_BACKOFF_FACTOR = float(os.environ.get("STOCK_PROPHET_HTTP_BACKOFF", "0.5"))
+HTTP_CONNECT_TIMEOUT = 5
+HTTP_READ_TIMEOUT = 30
+# Raw response bodies kept to answer 304 Not Modified revalidations
+HTTP_VALIDATOR_CACHE_MAX_BYTES = int(os.environ.get("STOCK_PROPHET_HTTP_CACHE_MB", "64")) * 1024 * 1024
+
+# API quota tracking
+QUOTA_FILE = os.path.join(CACHE_ROOT, "quota.json")
+RATE_LIMIT_MAX_WAIT = float(os.environ.get("STOCK_PROPHET_RATE_LIMIT_MAX_WAIT", "30"))
+
+# Points per chart trace after downsampling (0 sends every point, drawn with WebGL)
+CHART_MAX_POINTS = int(os.environ.get("STOCK_PROPHET_CHART_POINTS", "1500"))
+
+# Symbols whose technical indicators are kept in memory for incremental updates
+INDICATOR_CACHE_MAX_ENTRIES = int(os.environ.get("STOCK_PROPHET_INDICATOR_CACHE_ENTRIES", "256"))
+
+# Server-wide cache of fetched history (Arrow IPC); a redis:// URL shares it between replicas
+SHARED_CACHE_DIR = os.path.join(CACHE_ROOT, "shared")
+SHARED_CACHE_URL = os.environ.get("STOCK_PROPHET_SHARED_CACHE_URL")
+SHARED_CACHE_TTL_SECONDS = int(os.environ.get("STOCK_PROPHET_SHARED_CACHE_TTL", str(24 * 60 * 60)))
+SHARED_CACHE_MAX_BYTES = int(os.environ.get("STOCK_PROPHET_SHARED_CACHE_MB", "1024")) * 1024 * 1024
+
+# Precomputed (materialized) forecasts served by the app
+FORECAST_STORE_DIR = os.path.join(CACHE_ROOT, "forecasts")
+
+# Background forecast jobs shared by every session of a server process
+JOB_WORKERS = int(os.environ.get("STOCK_PROPHET_JOB_WORKERS", "4"))
+JOB_RETAIN_SECONDS = int(os.environ.get("STOCK_PROPHET_JOB_RETAIN_SECONDS", "600"))
+JOB_POLL_SECONDS = float(os.environ.get("STOCK_PROPHET_JOB_POLL_SECONDS", "1"))
+
+# Lock files that coalesce identical fetches and fits across worker processes
+SINGLEFLIGHT_LOCK_DIR = os.path.join(CACHE_ROOT, "locks")
@@ -5,10 +5,11 @@ Handles all data fetching from different APIs and CSV files
 
 import streamlit as st
 import pandas as pd
-import numpy as np
-import requests
-import json
-from datetime import datetime, date
+from datetime import date
+from . import ingest, market_data
+from .exceptions import StockProphetError
+from .market_data import FMP_START
+from .st_feedback import show_progress, show_error
 
 START = "2010-01-01"
 TODAY = date.today().strftime("%Y-%m-%d")
@@ -17,165 +18,59 @@ class DataSources:
     """Centralized data fetching for all supported APIs"""
     
     @staticmethod
-    @st.cache_data
-    def fetch_alpha_vantage_data(symbol, api_key):
-        """Fetch stock data from Alpha Vantage API"""
+    def fetch_alpha_vantage_data(symbol, api_key, outputsize='full'):
+        """Fetch stock data from Alpha Vantage API (via load_stock_history, which picks the output size)"""
+        return DataSources.load_stock_history('alpha_vantage', symbol, api_key)
+
+    @staticmethod
+    def fetch_fmp_data(symbol, api_key, start_date=FMP_START):
+        """Fetch stock data from Financial Modeling Prep API (via load_stock_history) from start_date on"""
+        data = DataSources.load_stock_history('fmp', symbol, api_key)
+        if data is None or start_date <= FMP_START:
+            return data
+        return data[data['Date'] >= pd.Timestamp(start_date)].reset_index(drop=True)
+
+    @staticmethod
+    def fetch_fallback_data(symbol):
+        """Try multiple fallback APIs"""
         try:
-            url = f"https://www.alphavantage.co/query"
-            params = {
-                'function': 'TIME_SERIES_DAILY',
-                'symbol': symbol,
-                'outputsize': 'full',
-                'apikey': api_key,
-                'datatype': 'json'
-            }
-            
-            with st.spinner(f"🔄 Fetching data for {symbol} from Alpha Vantage..."):
-                response = requests.get(url, params=params, timeout=30)
-                data = response.json()
-            
-            # Check for API errors
-            if "Error Message" in data:
-                st.error(f"❌ API Error: {data['Error Message']}")
-                if "Invalid API call" in data['Error Message']:
-                    st.warning("💡 **Tip:** Alpha Vantage only supports US stocks and ADRs. Try selecting a different data source for international stocks.")
-                return None
-            
-            if "Note" in data:
-                st.error(f"❌ API Limit: {data['Note']}")
-                st.info("⏰ Alpha Vantage free tier allows 25 requests/day. Please wait or upgrade your plan.")
-                return None
-            
-            if "Time Series (Daily)" not in data:
-                st.error(f"❌ No data found for symbol {symbol}")
-                if any(symbol.endswith(ext) for ext in ['.NS', '.T', '.KS', '.SW', '.PA', '.SR']):
-                    st.warning("🌍 **International Stock Detected:** Alpha Vantage doesn't support this exchange. Try Financial Modeling Prep or CSV upload instead.")
-                return None
-            
-            # Parse the data
-            time_series = data["Time Series (Daily)"]
-            
-            # Convert to DataFrame
-            df_data = []
-            for date_str, values in time_series.items():
-                df_data.append({
-                    'Date': datetime.strptime(date_str, '%Y-%m-%d'),
-                    'Open': float(values['1. open']),
-                    'High': float(values['2. high']),
-                    'Low': float(values['3. low']),
-                    'Close': float(values['4. close']),
-                    'Volume': int(values['5. volume'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('Date').reset_index(drop=True)
-            
-            st.success(f"✅ Alpha Vantage: Loaded {len(df)} days of data for {symbol}")
-            return df
-            
-        except Exception as e:
-            st.error(f"❌ Alpha Vantage Error: {str(e)}")
+            with st.spinner(f"🔄 Trying IEX Cloud for {symbol}..."):
+                return market_data.fetch_iex_fallback(symbol, progress=show_progress)
+        except Exception:
             return None
 
     @staticmethod
-    @st.cache_data
-    def fetch_fmp_data(symbol, api_key):
-        """Fetch stock data from Financial Modeling Prep API"""
+    def load_stock_history(source, symbol, api_key):
+        """Load history from the local store, fetching only bars newer than the last stored date"""
         try:
-            url = f"https://financialmodelingprep.com/api/v3/historical-price-full/{symbol}"
-            params = {
-                'apikey': api_key,
-                'from': '2020-01-01',
-                'to': TODAY
-            }
-            
-            with st.spinner(f"🔄 Fetching data for {symbol} from Financial Modeling Prep..."):
-                response = requests.get(url, params=params, timeout=30)
-                data = response.json()
-            
-            # Check for API errors
-            if "Error Message" in data:
-                st.error(f"❌ API Error: {data['Error Message']}")
-                return None
-                
-            if 'historical' not in data:
-                st.error(f"❌ No historical data found for {symbol}")
-                return None
-            
-            # Parse the data
-            historical_data = data['historical']
-            
-            # Convert to DataFrame
-            df_data = []
-            for item in historical_data:
-                df_data.append({
-                    'Date': datetime.strptime(item['date'], '%Y-%m-%d'),
-                    'Open': float(item['open']),
-                    'High': float(item['high']),
-                    'Low': float(item['low']),
-                    'Close': float(item['close']),
-                    'Volume': int(item['volume'])
-                })
-            
-            df = pd.DataFrame(df_data)
-            df = df.sort_values('Date').reset_index(drop=True)
-            
-            st.success(f"✅ Financial Modeling Prep: Loaded {len(df)} days of data for {symbol}")
-            return df
-            
+            with st.spinner(f"🔄 Loading market data for {symbol}..."):
+                return market_data.load_stock_history(source, symbol, api_key, progress=show_progress)
+        except StockProphetError as e:
+            show_error(e)
         except Exception as e:
-            st.error(f"❌ FMP Error: {str(e)}")
-            return None
+            st.error(f"❌ Data Error: {str(e)}")
+        return None
 
     @staticmethod
-    @st.cache_data
-    def fetch_fallback_data(symbol):
-        """Try multiple fallback APIs"""
-        # Try IEX Cloud
+    def load_uploaded_data(uploaded_file):
+        """Stream an uploaded CSV or Parquet file (one or many symbols) into a sorted DataFrame"""
         try:
-            url = f"https://cloud.iexapis.com/stable/stock/{symbol}/chart/2y"
-            params = {'token': 'pk_test', 'format': 'json'}
-            
-            with st.spinner(f"🔄 Trying IEX Cloud for {symbol}..."):
-                response = requests.get(url, params=params, timeout=20)
-                data = response.json()
-            
-            if isinstance(data, list) and len(data) > 0:
-                df_data = []
-                for item in data:
-                    if all(key in item for key in ['date', 'open', 'high', 'low', 'close', 'volume']):
-                        if item['close']:  # Skip null values
-                            df_data.append({
-                                'Date': datetime.strptime(item['date'], '%Y-%m-%d'),
-                                'Open': float(item['open']),
-                                'High': float(item['high']),
-                                'Low': float(item['low']),
-                                'Close': float(item['close']),
-                                'Volume': int(item['volume']) if item['volume'] else 0
-                            })
-                
-                if df_data:
-                    df = pd.DataFrame(df_data)
-                    df = df.sort_values('Date').reset_index(drop=True)
-                    st.success(f"✅ IEX Cloud Fallback: Loaded {len(df)} days of data for {symbol}")
-                    return df
-        except:
-            pass
-        
+            with st.spinner(f"📂 Reading {uploaded_file.name}..."):
+                return ingest.read_ohlcv_file(uploaded_file)
+        except StockProphetError as e:
+            show_error(e)
         return None
 
     @staticmethod
     def validate_csv_data(data):
-        """Validate uploaded CSV data format"""
-        required_columns = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
-        missing_columns = [col for col in required_columns if col not in data.columns]
-        
-        if missing_columns:
-            return False, f"Missing required columns: {missing_columns}"
+        """Validate uploaded CSV data format (the frame is not modified)"""
+        try:
+            ingest.validate_ohlcv_columns(data.columns)
+        except StockProphetError as e:
+            return False, e.message
         
         try:
-            # Convert Date column to datetime
-            data['Date'] = pd.to_datetime(data['Date'])
+            pd.to_datetime(data['Date'])
             return True, "CSV data is valid"
         except Exception as e:
             return False, f"Error processing CSV: {str(e)}"
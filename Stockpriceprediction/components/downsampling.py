@@ -0,0 +1,80 @@
+"""
+Downsampling Module
+Reduces long series to a chart's pixel budget before they are sent to the browser
+"""
+
+import numpy as np
+
+from .config import CHART_MAX_POINTS
+
+# Above this many plotted points, traces switch to WebGL (go.Scattergl)
+WEBGL_MIN_POINTS = 5000
+
+
+def _as_float(values):
+    values = np.asarray(values)
+    if np.issubdtype(values.dtype, np.datetime64):
+        return values.astype('datetime64[ns]').view(np.int64).astype(np.float64)
+    return values.astype(np.float64)
+
+
+def lttb_indices(x, y, n_out):
+    """Largest-Triangle-Three-Buckets: indices of n_out points that preserve the line's shape
+
+    The first and last points are always kept; every bucket in between
+    contributes the point forming the largest triangle with the previously
+    selected point and the average of the next bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = _as_float(x)
+    y = _as_float(y)
+
+    # Bucket i covers [edges[i], edges[i + 1]); the first and last points sit outside
+    every = (n - 2) / (n_out - 2)
+    edges = np.append((np.arange(n_out - 1) * every).astype(np.int64) + 1, n)
+    sums_x = np.add.reduceat(x, edges[:-1])
+    sums_y = np.add.reduceat(y, edges[:-1])
+    counts = np.diff(edges)
+    avg_x, avg_y = sums_x / counts, sums_y / counts
+
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        # Twice the triangle area; the constant factor does not change the argmax
+        area = np.abs((x[a] - avg_x[i + 1]) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y[i + 1] - y[a]))
+        a = start + int(np.argmax(area))
+        selected[i + 1] = a
+    return selected
+
+
+def downsample_indices(x, y, max_points=CHART_MAX_POINTS):
+    """Indices to plot for (x, y) within max_points; None means plot everything
+
+    max_points of 0 or None disables downsampling. Missing y values are
+    skipped rather than chosen as extremes.
+    """
+    if not max_points or len(y) <= max_points:
+        return None
+    y = np.asarray(y, dtype=np.float64)
+    finite = np.flatnonzero(np.isfinite(y))
+    if len(finite) < len(y):
+        return finite[lttb_indices(np.asarray(x)[finite], y[finite], max_points)]
+    return lttb_indices(x, y, max_points)
+
+
+def window(dates, start=None, end=None):
+    """Slice of a sorted datetime array covering [start, end] (binary search, no copy)"""
+    dates = np.asarray(dates, dtype='datetime64[ns]')
+    lo = 0 if start is None else np.searchsorted(dates, np.datetime64(start, 'ns'), side='left')
+    hi = len(dates) if end is None else np.searchsorted(dates, np.datetime64(end, 'ns'), side='right')
+    return slice(int(lo), int(hi))
+
+
+def use_webgl(n_points):
+    """Whether a trace of n_points should be drawn with go.Scattergl"""
+    return n_points > WEBGL_MIN_POINTS
@@ -0,0 +1,46 @@
+"""
+Exceptions Module
+Structured errors raised by the Streamlit-free core layer
+"""
+
+
+class StockProphetError(Exception):
+    """Base class for all Stock Prophet errors"""
+
+    def __init__(self, message, hint=None):
+        super().__init__(message)
+        self.message = message
+        self.hint = hint
+
+
+class DataSourceError(StockProphetError):
+    """A provider request failed or returned an error payload"""
+
+    def __init__(self, message, source=None, symbol=None, hint=None):
+        super().__init__(message, hint)
+        self.source = source
+        self.symbol = symbol
+
+
+class APILimitError(DataSourceError):
+    """The provider rejected the request because a rate limit or quota was hit"""
+
+
+class SymbolNotFoundError(DataSourceError):
+    """The provider has no data for the requested symbol"""
+
+
+class DataFormatError(StockProphetError):
+    """User-supplied data is missing required columns or cannot be parsed"""
+
+
+class InsufficientDataError(StockProphetError):
+    """Not enough observations to train a model"""
+
+
+class ModelTrainingError(StockProphetError):
+    """Fitting the forecasting model failed"""
+
+
+class ForecastError(StockProphetError):
+    """Generating predictions from a fitted model failed"""
@@ -0,0 +1,36 @@
+"""
+File Utilities Module
+Atomic file replacement and file-name-safe symbols shared by the on-disk stores
+"""
+
+import os
+import re
+import tempfile
+from contextlib import contextmanager
+
+
+@contextmanager
+def atomic_write(path, mode='wb'):
+    """Open a temporary file next to path that replaces path when the block completes
+
+    Readers see either the old or the new file, never a partial write. If
+    the block raises, path is left untouched and the temporary file removed.
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode) as f:
+            yield f
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def safe_symbol(symbol):
+    """Upper-cased symbol with every character that is unsafe in a file name replaced by '_'"""
+    return re.sub(r'[^A-Za-z0-9._-]', '_', symbol.upper())
@@ -0,0 +1,81 @@
+"""
+Forecast Cache Module
+Memory-bounded LRU cache of forecast frames keyed by training data and settings
+"""
+
+import threading
+from collections import OrderedDict
+
+from .config import FORECAST_CACHE_MAX_BYTES
+
+
+class ForecastCache:
+    """Keeps the longest-horizon forecast per (fingerprint, settings) and slices shorter ones from it"""
+
+    def __init__(self, max_bytes=FORECAST_CACHE_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _frame_bytes(forecast):
+        return int(forecast.memory_usage(index=True, deep=True).sum())
+
+    def get(self, fingerprint, settings, period_days, future_only=False):
+        """Return a forecast covering period_days future days, or None on a miss"""
+        key = (fingerprint, settings)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry['period_days'] < period_days:
+                return None
+            self._entries.move_to_end(key)
+
+        # Future rows are consecutive days appended after the history rows
+        forecast = entry['forecast']
+        start = entry['n_history'] if future_only else 0
+        return forecast.iloc[start:entry['n_history'] + period_days].reset_index(drop=True)
+
+    def put(self, fingerprint, settings, period_days, n_history, forecast):
+        """Store a forecast unless a longer horizon is already cached for the same key"""
+        key = (fingerprint, settings)
+        nbytes = self._frame_bytes(forecast)
+        if nbytes > self.max_bytes:
+            return
+
+        with self._lock:
+            existing = self._entries.pop(key, None)
+            if existing is not None:
+                self._total_bytes -= existing['nbytes']
+                if existing['period_days'] >= period_days:
+                    self._entries[key] = existing
+                    self._total_bytes += existing['nbytes']
+                    return
+
+            self._entries[key] = {
+                'forecast': forecast,
+                'period_days': period_days,
+                'n_history': n_history,
+                'nbytes': nbytes
+            }
+            self._total_bytes += nbytes
+
+            while self._total_bytes > self.max_bytes and self._entries:
+                _, evicted = self._entries.popitem(last=False)
+                self._total_bytes -= evicted['nbytes']
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    @property
+    def total_bytes(self):
+        return self._total_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared instance used by the forecasting core
+FORECAST_CACHE = ForecastCache()
@@ -0,0 +1,281 @@
+"""
+Forecasting Module
+Streamlit-free model training and forecasting (Prophet and closed-form backends)
+"""
+
+import copy
+import logging
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from .exceptions import InsufficientDataError, ModelTrainingError, ForecastError
+from .forecast_cache import FORECAST_CACHE
+from .model_cache import MODEL_CACHE
+from .models import LinearTrendModel, ExponentialGrowthModel
+from .progress import report, INFO, SUCCESS, WARNING
+from .singleflight import SINGLE_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Hyperparameters used for every Prophet fit (also part of the model cache key)
+PROPHET_PARAMS = {
+    'daily_seasonality': False,
+    'weekly_seasonality': True,
+    'yearly_seasonality': True,
+    'seasonality_mode': 'additive'
+}
+
+MIN_TRAINING_POINTS = 30
+
+# Prediction interval defaults (Prophet's own defaults)
+DEFAULT_INTERVAL_WIDTH = 0.80
+DEFAULT_UNCERTAINTY_SAMPLES = 1000
+
+# Latency vs. fidelity presets for predict(); 0 samples uses the analytic interval
+UNCERTAINTY_SAMPLES = {
+    'fast': 0,
+    'balanced': 200,
+    'full': 1000
+}
+
+
+# Columns kept in compact forecast frames; everything else predict() returns is dropped
+FORECAST_COLUMNS = ['ds', 'trend', 'yhat_lower', 'yhat_upper', 'yhat']
+SEASONAL_COLUMNS = ['weekly', 'yearly']
+FORECAST_DTYPE = np.float32
+
+
+def _make_prophet():
+    # Imported on first fit: prophet pulls in cmdstanpy and matplotlib
+    from prophet import Prophet
+    return Prophet(**PROPHET_PARAMS)
+
+
+# Forecasting backends. 'params' feed the training fingerprint and fitted
+# models of 'persist' backends are kept in the on-disk model cache.
+MODEL_BACKENDS = {
+    'prophet': {
+        'label': "Prophet",
+        'factory': _make_prophet,
+        'params': PROPHET_PARAMS,
+        'persist': True
+    },
+    'linear': {
+        'label': "Linear Trend",
+        'factory': LinearTrendModel,
+        'params': {'model': 'linear'},
+        'persist': False
+    },
+    'exponential': {
+        'label': "Exponential Growth",
+        'factory': ExponentialGrowthModel,
+        'params': {'model': 'exponential'},
+        'persist': False
+    }
+}
+
+
+def prepare_training_frame(data):
+    """Convert an OHLCV frame into Prophet's ds/y training frame"""
+    df_train = data[['Date', 'Close']].copy()
+    df_train = df_train.rename(columns={"Date": "ds", "Close": "y"})
+    df_train = df_train.dropna()
+
+    if len(df_train) < MIN_TRAINING_POINTS:
+        raise InsufficientDataError(
+            f"Insufficient data for prediction. Need at least {MIN_TRAINING_POINTS} data points.")
+    return df_train
+
+
+def train_model(df_train, use_cache=True, progress=None, model_name='prophet', warm_start_key=None,
+                model_cache=None):
+    """Fit the named backend on df_train, reusing a cached fit for identical data and settings
+
+    With a warm_start_key (usually the symbol), Prophet refits start the
+    optimizer from the parameters of that key's previous fit, so a few new
+    bars converge in far fewer L-BFGS iterations. Concurrent calls for the
+    same data and settings fit once, across threads and worker processes.
+    The returned model carries a training_fingerprint attribute that keys
+    the forecast cache. model_cache defaults to the shared MODEL_CACHE.
+    """
+    backend = MODEL_BACKENDS.get(model_name)
+    if backend is None:
+        raise ValueError(f"Unknown model: {model_name}")
+
+    model_cache = model_cache or MODEL_CACHE
+    fingerprint = model_cache.make_key(df_train, backend['params'])
+    if use_cache and backend['persist']:
+        cached_model = model_cache.get(fingerprint)
+        if cached_model is not None:
+            cached_model.training_fingerprint = fingerprint
+            report(logger, progress, SUCCESS, "Loaded previously trained model from cache")
+            return cached_model
+
+        model, shared = SINGLE_FLIGHT.do(f"fit:{model_cache.cache_dir}:{fingerprint}", _fit_model, df_train,
+                                         backend, fingerprint, model_cache, warm_start_key, progress,
+                                         recheck=lambda: model_cache.get(fingerprint))
+        if shared:
+            # generate_forecast sets interval options on the model, so each caller gets its own copy
+            model = model_cache.get(fingerprint) or copy.deepcopy(model)
+    else:
+        model = _fit_model(df_train, backend, fingerprint, None, warm_start_key, progress)
+
+    model.training_fingerprint = fingerprint
+    return model
+
+
+def _fit_model(df_train, backend, fingerprint, model_cache, warm_start_key, progress):
+    """Fit a fresh backend model and, given a model_cache, store it under fingerprint"""
+    fit_kwargs = {}
+    warm_start = model_cache is not None and warm_start_key is not None
+    if warm_start:
+        init = model_cache.load_warm_start(warm_start_key)
+        if init is not None:
+            # Prophet falls back to its default inits if shapes no longer match
+            fit_kwargs['init'] = init
+
+    report(logger, progress, INFO, f"Training {backend['label']} model"
+           + (" (warm start)..." if fit_kwargs else "..."))
+    try:
+        model = backend['factory']()
+        model.fit(df_train, **fit_kwargs)
+    except Exception as e:
+        raise ModelTrainingError(f"Model training failed: {e}") from e
+
+    if model_cache is not None:
+        try:
+            model_cache.put(fingerprint, model)
+            if warm_start:
+                model_cache.save_warm_start(warm_start_key, model)
+        except Exception as e:
+            report(logger, progress, WARNING, f"Could not cache trained model: {e}")
+
+    report(logger, progress, SUCCESS, "Model training completed")
+    return model
+
+
+def _forecast_settings(model):
+    """Model settings that change predict() output without changing the fit"""
+    return (model.interval_width, model.uncertainty_samples)
+
+
+def _add_analytic_interval(model, forecast, interval_width):
+    """Closed-form yhat_lower/yhat_upper used when uncertainty sampling is disabled
+
+    Combines observation noise (sigma_obs) with the variance Prophet's
+    simulated future changepoints would add: Poisson arrivals at the
+    historical changepoint rate with Laplace-distributed slope jumps.
+    """
+    z = NormalDist().inv_cdf(0.5 + interval_width / 2)
+    sigma_obs = float(np.mean(model.params['sigma_obs']))
+    jump_scale = float(np.mean(np.abs(model.params['delta']))) + 1e-8
+    n_changepoints = len(model.changepoints_t) if model.changepoints_t is not None else 0
+
+    # Scaled time is 1.0 at the end of history; only future rows gain trend variance
+    t = ((forecast['ds'] - model.start) / model.t_scale).to_numpy(dtype=np.float64)
+    horizon = np.clip(t - 1.0, 0.0, None)
+    trend_var = 2.0 * n_changepoints * jump_scale ** 2 * horizon ** 3 / 3.0
+
+    half_width = z * np.sqrt(sigma_obs ** 2 + trend_var) * model.y_scale
+    forecast['yhat_lower'] = forecast['yhat'] - half_width
+    forecast['yhat_upper'] = forecast['yhat'] + half_width
+    return forecast
+
+
+def predict_with_interval(model, future):
+    """model.predict(future), with the analytic interval added when uncertainty sampling is disabled"""
+    forecast = model.predict(future)
+    if not model.uncertainty_samples and 'yhat_lower' not in forecast.columns:
+        forecast = _add_analytic_interval(model, forecast, model.interval_width)
+    return forecast
+
+
+def compact_forecast(forecast, n_history=0, future_only=False):
+    """Reduce a predict() frame to the compact forecast layout
+
+    Keeps ds plus the FORECAST_COLUMNS and SEASONAL_COLUMNS present, as
+    float32, and drops the ~15 other component columns Prophet returns.
+    With future_only, the first n_history (fitted history) rows are
+    dropped as well.
+    """
+    start = n_history if future_only else 0
+    frame = {'ds': forecast['ds'].to_numpy(dtype='datetime64[ns]')[start:]}
+    for name in FORECAST_COLUMNS[1:] + SEASONAL_COLUMNS:
+        if name in forecast.columns:
+            frame[name] = forecast[name].to_numpy(dtype=FORECAST_DTYPE)[start:]
+    return pd.DataFrame(frame)
+
+
+def forecast_nbytes(forecast):
+    """Memory held by a forecast frame, index included"""
+    return int(forecast.memory_usage(index=True, deep=True).sum())
+
+
+def generate_forecast(model, period_days, use_cache=True, interval_width=None, uncertainty_samples=None,
+                      future_only=False):
+    """Predict period_days beyond the end of the training data
+
+    interval_width and uncertainty_samples override the model's settings;
+    uncertainty_samples=0 skips sampling and adds an analytic interval.
+    Returns a compact forecast frame (see compact_forecast), optionally
+    limited to the future rows. Results are memoized per training
+    fingerprint and settings; a cached longer horizon is sliced to serve
+    shorter ones.
+    """
+    if interval_width is not None:
+        model.interval_width = interval_width
+    if uncertainty_samples is not None:
+        model.uncertainty_samples = uncertainty_samples
+
+    fingerprint = getattr(model, 'training_fingerprint', None) if use_cache else None
+    if fingerprint:
+        cached = FORECAST_CACHE.get(fingerprint, _forecast_settings(model), period_days, future_only)
+        if cached is not None:
+            return cached
+
+    try:
+        future = model.make_future_dataframe(periods=period_days)
+        forecast = predict_with_interval(model, future)
+    except Exception as e:
+        raise ForecastError(f"Forecast generation failed: {e}") from e
+
+    # The cache keeps history rows so it can serve both full and future-only requests
+    n_history = len(model.history)
+    forecast = compact_forecast(forecast)
+    if fingerprint:
+        FORECAST_CACHE.put(fingerprint, _forecast_settings(model), period_days, n_history, forecast)
+    if future_only:
+        return forecast.iloc[n_history:].reset_index(drop=True)
+    return forecast
+
+
+def extract_prediction_metrics(data, forecast):
+    """Summarize the forecast end point against the last observed close"""
+    current_price = data['Close'].iloc[-1]
+    future_price = forecast['yhat'].iloc[-1]
+
+    metrics = {
+        'current_price': current_price,
+        'future_price': future_price,
+        'price_change': future_price - current_price,
+        'price_change_pct': ((future_price - current_price) / current_price) * 100
+    }
+    if 'yhat_upper' in forecast.columns and 'yhat_lower' in forecast.columns:
+        metrics['confidence_upper'] = forecast['yhat_upper'].iloc[-1]
+        metrics['confidence_lower'] = forecast['yhat_lower'].iloc[-1]
+    return metrics
+
+
+def run_forecast(data, n_years, use_cache=True, progress=None, model_name='prophet',
+                 interval_width=DEFAULT_INTERVAL_WIDTH, uncertainty_samples=DEFAULT_UNCERTAINTY_SAMPLES,
+                 warm_start_key=None, future_only=False):
+    """Prepare, fit and forecast in one call; returns (model, forecast, metrics)"""
+    df_train = prepare_training_frame(data)
+    model = train_model(df_train, use_cache=use_cache, progress=progress, model_name=model_name,
+                        warm_start_key=warm_start_key)
+    forecast = generate_forecast(model, int(n_years * 365), use_cache=use_cache,
+                                 interval_width=interval_width, uncertainty_samples=uncertainty_samples,
+                                 future_only=future_only)
+    return model, forecast, extract_prediction_metrics(data, forecast)
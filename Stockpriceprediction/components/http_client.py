@@ -0,0 +1,95 @@
+"""
+HTTP Client Module
+Shared pooled HTTP session with retries, backoff and conditional requests
+"""
+
+import json
+import threading
+from collections import OrderedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from .config import (
+    HTTP_POOL_SIZE, HTTP_RETRIES, HTTP_BACKOFF_FACTOR, HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT,
+    HTTP_VALIDATOR_CACHE_MAX_BYTES
+)
+
+
+class HTTPClient:
+    """Keep-alive connection pool that retries transient failures with exponential backoff
+
+    Responses with an ETag or Last-Modified header are kept as raw bytes
+    (LRU, at most validator_max_bytes in total) and re-parsed when the
+    server answers a revalidation with 304 Not Modified.
+    """
+
+    def __init__(self, pool_size=HTTP_POOL_SIZE, retries=HTTP_RETRIES, backoff_factor=HTTP_BACKOFF_FACTOR,
+                 timeout=(HTTP_CONNECT_TIMEOUT, HTTP_READ_TIMEOUT),
+                 validator_max_bytes=HTTP_VALIDATOR_CACHE_MAX_BYTES):
+        self.timeout = timeout
+        self.validator_max_bytes = validator_max_bytes
+        retry = Retry(
+            total=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size, max_retries=retry)
+        self.session = requests.Session()
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self._validators = OrderedDict()
+        self._validator_bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _cache_key(url, params):
+        return url, tuple(sorted((params or {}).items()))
+
+    def get_json(self, url, params=None, timeout=None):
+        """GET a JSON document, revalidating with ETag/Last-Modified when seen before"""
+        key = self._cache_key(url, params)
+        headers = {}
+        with self._lock:
+            cached = self._validators.get(key)
+        if cached is not None:
+            if cached['etag']:
+                headers['If-None-Match'] = cached['etag']
+            if cached['last_modified']:
+                headers['If-Modified-Since'] = cached['last_modified']
+
+        response = self.session.get(url, params=params, headers=headers,
+                                    timeout=timeout or self.timeout)
+        if response.status_code == 304 and cached is not None:
+            with self._lock:
+                self._validators.move_to_end(key)
+            return json.loads(cached['content'])
+
+        body = response.json()
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if response.ok and (etag or last_modified) and len(response.content) <= self.validator_max_bytes:
+            self._remember(key, {'etag': etag, 'last_modified': last_modified, 'content': response.content})
+        return body
+
+    def _remember(self, key, entry):
+        with self._lock:
+            previous = self._validators.pop(key, None)
+            if previous is not None:
+                self._validator_bytes -= len(previous['content'])
+            self._validators[key] = entry
+            self._validator_bytes += len(entry['content'])
+            while self._validator_bytes > self.validator_max_bytes:
+                _, evicted = self._validators.popitem(last=False)
+                self._validator_bytes -= len(evicted['content'])
+
+    def close(self):
+        self.session.close()
+
+
+# Shared instance used by the data fetchers
+HTTP_CLIENT = HTTPClient()
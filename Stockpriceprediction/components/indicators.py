@@ -0,0 +1,195 @@
+"""
+Indicators Module
+Vectorized technical indicators over OHLCV frames, cached per symbol and extended incrementally
+
+Usage:
+    frame = INDICATOR_CACHE.indicators('AAPL', data)
+    frame, state = compute_indicators(data)
+    frame, state = extend_indicators(frame, state, data)
+"""
+
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+from .config import INDICATOR_CACHE_MAX_ENTRIES
+
+SMA_WINDOWS = [20, 50, 200]
+EMA_SPANS = [12, 26]
+MACD_SIGNAL_SPAN = 9
+RSI_PERIOD = 14
+ATR_PERIOD = 14
+BOLLINGER_WINDOW = 20
+BOLLINGER_STDS = 2
+VWAP_WINDOW = 20
+
+# Trading days in a year, for the rolling 52-week high/low
+TRADING_DAYS_52W = 252
+
+INDICATOR_COLUMNS = (
+    [f'SMA_{window}' for window in SMA_WINDOWS]
+    + [f'EMA_{span}' for span in EMA_SPANS]
+    + ['MACD', 'MACD_signal', 'MACD_hist', f'RSI_{RSI_PERIOD}',
+       'BB_upper', 'BB_middle', 'BB_lower', f'ATR_{ATR_PERIOD}',
+       'High_52W', 'Low_52W', f'VWAP_{VWAP_WINDOW}']
+)
+
+# Rows before the first new bar that the rolling windows need to see
+_LOOKBACK = max(SMA_WINDOWS + [BOLLINGER_WINDOW, VWAP_WINDOW, TRADING_DAYS_52W]) - 1
+
+
+def _ewm(values, alpha, seed=None):
+    """Recursive EMA (pandas adjust=False), continuing from seed if one is given"""
+    if seed is None:
+        return pd.Series(values).ewm(alpha=alpha, adjust=False).mean().to_numpy()
+    seeded = np.concatenate([[seed], values])
+    return pd.Series(seeded).ewm(alpha=alpha, adjust=False).mean().to_numpy()[1:]
+
+
+def _rolling(values, window, how, min_periods=None):
+    return getattr(pd.Series(values).rolling(window, min_periods=min_periods), how)().to_numpy()
+
+
+def _compute(data, start=0, state=None):
+    """Indicator columns for rows [start:] of data, plus the recursive state after the last row
+
+    Rolling windows are evaluated over the preceding _LOOKBACK rows and the
+    new rows only; EMA-based indicators (EMA, MACD, RSI, ATR) continue from
+    state, so extending a series costs O(new rows + lookback).
+    """
+    state = state or {}
+    lo = max(start - _LOOKBACK, 0)
+    high = data['High'].to_numpy(dtype=np.float64)[lo:]
+    low = data['Low'].to_numpy(dtype=np.float64)[lo:]
+    close = data['Close'].to_numpy(dtype=np.float64)[lo:]
+    volume = data['Volume'].to_numpy(dtype=np.float64)[lo:]
+    new = slice(start - lo, None)
+    out = {}
+    new_state = {}
+
+    for window in SMA_WINDOWS:
+        out[f'SMA_{window}'] = _rolling(close, window, 'mean')[new]
+
+    for span in EMA_SPANS:
+        ema = _ewm(close[new], 2 / (span + 1), state.get(f'EMA_{span}'))
+        out[f'EMA_{span}'] = new_state[f'EMA_{span}'] = ema
+    macd = out[f'EMA_{EMA_SPANS[0]}'] - out[f'EMA_{EMA_SPANS[1]}']
+    signal = _ewm(macd, 2 / (MACD_SIGNAL_SPAN + 1), state.get('MACD_signal'))
+    out.update(MACD=macd, MACD_signal=signal, MACD_hist=macd - signal)
+    new_state['MACD_signal'] = signal
+
+    # Wilder smoothing; the first change needs the close before the first new row
+    previous_close = np.concatenate([[state.get('close', np.nan)], close[new][:-1]])
+    change = close[new] - previous_close
+    avg_gain = _ewm(np.where(np.isnan(change), np.nan, np.fmax(change, 0)), 1 / RSI_PERIOD,
+                    state.get('avg_gain'))
+    avg_loss = _ewm(np.where(np.isnan(change), np.nan, np.fmax(-change, 0)), 1 / RSI_PERIOD,
+                    state.get('avg_loss'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rsi = np.where(avg_loss == 0, 100.0, 100 - 100 / (1 + avg_gain / avg_loss))
+    new_state.update(avg_gain=avg_gain, avg_loss=avg_loss)
+
+    true_range = np.fmax(high[new] - low[new],
+                         np.fmax(np.abs(high[new] - previous_close), np.abs(low[new] - previous_close)))
+    atr = _ewm(true_range, 1 / ATR_PERIOD, state.get('atr'))
+    new_state['atr'] = atr
+
+    # Warm-up rows count from the start of the series, not of this slice
+    row = np.arange(start, len(data))
+    out[f'RSI_{RSI_PERIOD}'] = np.where(row < RSI_PERIOD, np.nan, rsi)
+    out[f'ATR_{ATR_PERIOD}'] = np.where(row < ATR_PERIOD - 1, np.nan, atr)
+
+    middle = _rolling(close, BOLLINGER_WINDOW, 'mean')
+    spread = BOLLINGER_STDS * _rolling(close, BOLLINGER_WINDOW, 'std')
+    out.update(BB_upper=(middle + spread)[new], BB_middle=middle[new], BB_lower=(middle - spread)[new])
+
+    # Shorter histories report the range since the first bar
+    out['High_52W'] = _rolling(high, TRADING_DAYS_52W, 'max', min_periods=1)[new]
+    out['Low_52W'] = _rolling(low, TRADING_DAYS_52W, 'min', min_periods=1)[new]
+
+    typical = (high + low + close) / 3
+    traded = _rolling(typical * volume, VWAP_WINDOW, 'sum')
+    shares = _rolling(volume, VWAP_WINDOW, 'sum')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        out[f'VWAP_{VWAP_WINDOW}'] = np.where(shares > 0, traded / shares, np.nan)[new]
+
+    frame = pd.DataFrame(out, columns=INDICATOR_COLUMNS)
+    frame.insert(0, 'Date', data['Date'].to_numpy()[start:])
+    state = {name: values[-1] for name, values in new_state.items()} if len(frame) else dict(state)
+    if len(frame):
+        state['close'] = close[-1]
+    return frame, state
+
+
+def compute_indicators(data):
+    """Compute every indicator over a Date/OHLCV frame; returns (frame, state)
+
+    frame has a Date column followed by INDICATOR_COLUMNS, one row per bar;
+    state carries what extend_indicators needs to continue the series.
+    """
+    return _compute(data)
+
+
+def extend_indicators(frame, state, data):
+    """Append indicator rows for the bars of data beyond the len(frame) already computed"""
+    if len(data) <= len(frame):
+        return frame, state
+    tail, state = _compute(data, start=len(frame), state=state)
+    return pd.concat([frame, tail], ignore_index=True), state
+
+
+class IndicatorCache:
+    """Per-symbol indicator frames that are extended, not recomputed, when bars are appended"""
+
+    def __init__(self, max_entries=INDICATOR_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _extends(entry, data):
+        """True if data is the cached series with zero or more bars appended"""
+        n = len(entry['frame'])
+        if n == 0 or len(data) < n:
+            return False
+        dates = data['Date'].to_numpy()
+        return (dates[0] == entry['first_date'] and dates[n - 1] == entry['last_date']
+                and data['Close'].to_numpy()[n - 1] == entry['state']['close'])
+
+    def indicators(self, key, data):
+        """Indicator frame for data, reusing and extending the frame cached under key"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+
+        if entry is not None and self._extends(entry, data):
+            if len(data) == len(entry['frame']):
+                return entry['frame']
+            frame, state = extend_indicators(entry['frame'], entry['state'], data)
+        else:
+            # New symbol, or the history was revised or trimmed
+            frame, state = compute_indicators(data)
+
+        if len(frame):
+            dates = data['Date'].to_numpy()
+            with self._lock:
+                self._entries[key] = {'frame': frame, 'state': state,
+                                      'first_date': dates[0], 'last_date': dates[-1]}
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return frame
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared instance used by the dashboard; survives Streamlit reruns within a process
+INDICATOR_CACHE = IndicatorCache()
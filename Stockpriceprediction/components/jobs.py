@@ -0,0 +1,145 @@
+"""
+Jobs Module
+Background job queue that keeps model fits off the Streamlit script thread
+
+Jobs are keyed: submitting a key that is already queued, running or
+finished (successfully or not) within the last JOB_RETAIN_SECONDS returns
+the existing job, so sessions asking for the same forecast share one fit
+and a failed fit is reported rather than retried on every rerun.
+
+Usage:
+    queue = JobQueue()
+    job = queue.submit(key, forecasting.run_forecast, data, 1.0)
+    queue.status(job.id)   # {'status': 'running', 'elapsed': 2.4, ...}
+"""
+
+import multiprocessing
+import threading
+import time
+import uuid
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+from .config import JOB_WORKERS, JOB_RETAIN_SECONDS
+
+QUEUED = 'queued'
+RUNNING = 'running'
+DONE = 'done'
+FAILED = 'failed'
+
+
+def process_pool(max_workers=None):
+    """ProcessPoolExecutor whose workers never fork from this (multi-threaded) process
+
+    Forking copies locks held by other threads (single-flight, fetch
+    threads, Streamlit's server) into the child, where they never get
+    released; forkserver (spawn where unavailable) starts workers from a
+    clean single-threaded process instead.
+    """
+    start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(start_method))
+
+
+class Job:
+    """One submitted call; its status is read from the underlying future"""
+
+    def __init__(self, key, future):
+        self.id = uuid.uuid4().hex[:12]
+        self.key = key
+        self.future = future
+        self.submitted_at = time.time()
+        self.finished_at = None
+
+    @property
+    def finished(self):
+        return self.future.done()
+
+    @property
+    def status(self):
+        if self.future.done():
+            return FAILED if self.future.cancelled() or self.future.exception() else DONE
+        return RUNNING if self.future.running() else QUEUED
+
+    def result(self, timeout=None):
+        """The call's return value; re-raises its exception"""
+        return self.future.result(timeout)
+
+    def to_dict(self):
+        end = self.finished_at or time.time()
+        error = None
+        if self.status == FAILED:
+            error = "cancelled" if self.future.cancelled() else str(self.future.exception())
+        return {'id': self.id, 'key': self.key, 'status': self.status,
+                'submitted_at': self.submitted_at, 'elapsed': end - self.submitted_at, 'error': error}
+
+    def _finish(self, _future):
+        self.finished_at = time.time()
+
+
+class JobQueue:
+    """Thread (default) or process pool with deduplication of identical in-flight jobs
+
+    Threads suit Prophet, whose fit runs in a cmdstan subprocess; with
+    processes=True the function, arguments and result must be picklable.
+    Failed jobs are kept like finished ones; forget() a job to retry it.
+    """
+
+    def __init__(self, max_workers=JOB_WORKERS, processes=False, retain_seconds=JOB_RETAIN_SECONDS):
+        self._executor = process_pool(max_workers) if processes else ThreadPoolExecutor(max_workers=max_workers)
+        self.retain_seconds = retain_seconds
+        self._jobs = {}
+        self._by_key = {}
+        self._lock = threading.Lock()
+
+    def submit(self, key, fn, *args, **kwargs):
+        """Run fn(*args, **kwargs) for key, or return the job already holding key"""
+        with self._lock:
+            self._expire()
+            job = self._by_key.get(key)
+            if job is not None:
+                return job
+
+            job = Job(key, self._executor.submit(fn, *args, **kwargs))
+            job.future.add_done_callback(job._finish)
+            self._jobs[job.id] = job
+            self._by_key[key] = job
+            return job
+
+    def get(self, job_id):
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def status(self, job_id):
+        """Status dict of a job, or None if it is unknown or expired"""
+        job = self.get(job_id)
+        return None if job is None else job.to_dict()
+
+    def forget(self, job_id):
+        """Drop a finished job so the next submit of its key runs again (e.g. an explicit retry)"""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return False
+            del self._jobs[job_id]
+            if self._by_key.get(job.key) is job:
+                del self._by_key[job.key]
+            return True
+
+    def jobs(self):
+        """Status dicts of every retained job, oldest first"""
+        with self._lock:
+            return [job.to_dict() for job in self._jobs.values()]
+
+    def _expire(self):
+        """Forget finished jobs older than retain_seconds (caller holds the lock)"""
+        cutoff = time.time() - self.retain_seconds
+        for job_id, job in list(self._jobs.items()):
+            if job.finished_at is not None and job.finished_at < cutoff:
+                del self._jobs[job_id]
+                if self._by_key.get(job.key) is job:
+                    del self._by_key[job.key]
+
+    def shutdown(self, wait=True):
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+    def __len__(self):
+        return len(self._jobs)
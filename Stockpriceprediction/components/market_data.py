@@ -0,0 +1,260 @@
+"""
+Market Data Module
+Streamlit-free fetching of daily OHLCV history from the supported APIs
+"""
+
+import asyncio
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+from functools import partial
+
+import requests
+
+from .exceptions import DataSourceError, APILimitError, SymbolNotFoundError
+from .http_client import HTTP_CLIENT
+from .ohlcv_store import OHLCV_STORE
+from .parsing import parse_alpha_vantage, parse_fmp, parse_iex
+from .progress import report, INFO, SUCCESS, WARNING
+from .rate_limiter import RATE_LIMITER, DEFAULT_WAIT
+from .shared_cache import SHARED_CACHE, history_key
+from .singleflight import SINGLE_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+FMP_START = "2020-01-01"
+
+# Alpha Vantage "compact" responses only contain the latest 100 bars
+ALPHA_VANTAGE_COMPACT_BARS = 100
+
+# Exchanges Alpha Vantage does not cover
+INTERNATIONAL_SUFFIXES = ['.NS', '.T', '.KS', '.SW', '.PA', '.SR']
+
+SOURCE_NAMES = {
+    'alpha_vantage': "Alpha Vantage",
+    'fmp': "Financial Modeling Prep",
+}
+
+
+def _get_json(url, params, source, symbol, timeout=None):
+    try:
+        return HTTP_CLIENT.get_json(url, params=params, timeout=timeout)
+    except (requests.RequestException, ValueError) as e:
+        raise DataSourceError(f"{SOURCE_NAMES.get(source, source)} request failed: {e}",
+                              source=source, symbol=symbol) from e
+
+
+def _parse(parser, payload, source, symbol):
+    try:
+        return parser(payload)
+    except (KeyError, TypeError, ValueError) as e:
+        raise DataSourceError(f"Unexpected {SOURCE_NAMES[source]} response format: {e}",
+                              source=source, symbol=symbol) from e
+
+
+def fetch_alpha_vantage(symbol, api_key, outputsize='full', progress=None, max_wait=DEFAULT_WAIT):
+    """Fetch daily bars from Alpha Vantage ('full' history or the 'compact' last 100 bars)
+
+    max_wait bounds the wait for the per-minute rate limit (see RateLimiter.acquire).
+    """
+    report(logger, progress, INFO, f"Fetching data for {symbol} from Alpha Vantage...")
+    params = {
+        'function': 'TIME_SERIES_DAILY',
+        'symbol': symbol,
+        'outputsize': outputsize,
+        'apikey': api_key,
+        'datatype': 'json'
+    }
+    RATE_LIMITER.acquire('alpha_vantage', api_key, max_wait)
+    data = _get_json("https://www.alphavantage.co/query", params, 'alpha_vantage', symbol)
+
+    if "Error Message" in data:
+        hint = None
+        if "Invalid API call" in data['Error Message']:
+            hint = ("Alpha Vantage only supports US stocks and ADRs. "
+                    "Try selecting a different data source for international stocks.")
+        raise SymbolNotFoundError(f"API Error: {data['Error Message']}",
+                                  source='alpha_vantage', symbol=symbol, hint=hint)
+
+    # Throttled responses arrive as "Note" (per minute) or "Information" (daily cap)
+    if "Note" in data or ("Information" in data and "rate limit" in data['Information'].lower()):
+        RATE_LIMITER.exhaust('alpha_vantage', api_key)
+        raise APILimitError(f"API Limit: {data.get('Note') or data['Information']}", source='alpha_vantage', symbol=symbol,
+                            hint="Alpha Vantage free tier allows 25 requests/day. Please wait or upgrade your plan.")
+
+    if "Time Series (Daily)" not in data:
+        hint = None
+        if any(symbol.endswith(ext) for ext in INTERNATIONAL_SUFFIXES):
+            hint = ("International Stock Detected: Alpha Vantage doesn't support this exchange. "
+                    "Try Financial Modeling Prep or CSV upload instead.")
+        raise SymbolNotFoundError(f"No data found for symbol {symbol}",
+                                  source='alpha_vantage', symbol=symbol, hint=hint)
+
+    df = _parse(parse_alpha_vantage, data["Time Series (Daily)"], 'alpha_vantage', symbol)
+    report(logger, progress, SUCCESS, f"Alpha Vantage: Loaded {len(df)} days of data for {symbol}")
+    return df
+
+
+def fetch_fmp(symbol, api_key, start_date=FMP_START, progress=None, max_wait=DEFAULT_WAIT):
+    """Fetch daily bars from Financial Modeling Prep starting at start_date
+
+    max_wait bounds the wait for the per-minute rate limit (see RateLimiter.acquire).
+    """
+    report(logger, progress, INFO, f"Fetching data for {symbol} from Financial Modeling Prep...")
+    params = {
+        'apikey': api_key,
+        'from': start_date,
+        'to': date.today().strftime("%Y-%m-%d")
+    }
+    url = f"https://financialmodelingprep.com/api/v3/historical-price-full/{symbol}"
+    RATE_LIMITER.acquire('fmp', api_key, max_wait)
+    data = _get_json(url, params, 'fmp', symbol)
+
+    if "Error Message" in data:
+        raise DataSourceError(f"API Error: {data['Error Message']}", source='fmp', symbol=symbol)
+
+    if 'historical' not in data:
+        raise SymbolNotFoundError(f"No historical data found for {symbol}", source='fmp', symbol=symbol)
+
+    df = _parse(parse_fmp, data['historical'], 'fmp', symbol)
+    report(logger, progress, SUCCESS, f"Financial Modeling Prep: Loaded {len(df)} days of data for {symbol}")
+    return df
+
+
+def fetch_iex_fallback(symbol, progress=None):
+    """Try the IEX Cloud fallback; returns None instead of raising"""
+    report(logger, progress, INFO, f"Trying IEX Cloud for {symbol}...")
+    try:
+        data = HTTP_CLIENT.get_json(f"https://cloud.iexapis.com/stable/stock/{symbol}/chart/2y",
+                                    params={'token': 'pk_test', 'format': 'json'})
+    except (requests.RequestException, ValueError) as e:
+        logger.debug("IEX Cloud fallback failed for %s: %s", symbol, e)
+        return None
+
+    if isinstance(data, list) and len(data) > 0:
+        try:
+            df = parse_iex(data)
+        except (KeyError, TypeError, ValueError) as e:
+            logger.debug("IEX Cloud fallback returned an unexpected format for %s: %s", symbol, e)
+            return None
+        if not df.empty:
+            report(logger, progress, SUCCESS, f"IEX Cloud Fallback: Loaded {len(df)} days of data for {symbol}")
+            return df
+    return None
+
+
+def load_stock_history(source, symbol, api_key, store=OHLCV_STORE, progress=None, shared_cache=SHARED_CACHE,
+                       max_wait=DEFAULT_WAIT, fresh_after=None):
+    """Load history from the local store, fetching only bars newer than the last stored date
+
+    Today's history is first looked up in the shared cache, so sessions,
+    workers and replicas fetch each symbol once per day; concurrent misses
+    for the same symbol are coalesced into one refresh. Falls back to
+    stored data when a refresh fails (without sharing it); raises
+    DataSourceError when nothing is stored and the provider request fails.
+
+    fresh_after (a POSIX timestamp, e.g. the last market close) demands data
+    fetched at or after that time: the shared cache is skipped, older stored
+    data is refetched from its last bar (replacing an intraday snapshot of
+    it), and a failed refresh raises instead of serving stored data.
+    """
+    if source not in SOURCE_NAMES:
+        raise ValueError(f"Unknown data source: {source}")
+
+    key = history_key(source, symbol)
+    if shared_cache is None:
+        return _refresh_history(source, symbol, api_key, store, progress, None, key, max_wait, fresh_after)
+
+    if fresh_after is None:
+        shared = shared_cache.get(key)
+        if shared is not None:
+            return shared
+        flight_key, recheck = f"history:{store.root}:{key}", lambda: shared_cache.get(key)
+    else:
+        flight_key, recheck = f"history:{store.root}:{key}:after:{fresh_after}", None
+    history, _ = SINGLE_FLIGHT.do(flight_key, _refresh_history,
+                                  source, symbol, api_key, store, progress, shared_cache, key, max_wait,
+                                  fresh_after, recheck=recheck)
+    return history
+
+
+def _refresh_history(source, symbol, api_key, store, progress, shared_cache, key, max_wait, fresh_after=None):
+    """Stored history, topped up from the provider when trading days are missing"""
+    stored = store.load(source, symbol)
+    if stored is not None and stored.empty:
+        stored = None
+    if stored is not None:
+        if fresh_after is not None:
+            current = store.is_fresh(source, symbol, fresh_after)
+        else:
+            current = store.is_fresh(source, symbol) or store.missing_trading_days(stored) == 0
+        if current:
+            if shared_cache is not None:
+                shared_cache.set(key, stored)
+            return stored
+
+    try:
+        if source == 'alpha_vantage':
+            if stored is not None and store.missing_trading_days(stored) < ALPHA_VANTAGE_COMPACT_BARS:
+                outputsize = 'compact'
+            else:
+                outputsize = 'full'
+            new_bars = fetch_alpha_vantage(symbol, api_key, outputsize, progress=progress, max_wait=max_wait)
+        else:
+            if stored is None:
+                start_date = FMP_START
+            elif fresh_after is not None:
+                # The last stored bar may be an intraday snapshot; merge() replaces it with the final bar
+                start_date = stored['Date'].iloc[-1].strftime("%Y-%m-%d")
+            else:
+                start_date = (stored['Date'].iloc[-1] + timedelta(days=1)).strftime("%Y-%m-%d")
+            new_bars = fetch_fmp(symbol, api_key, start_date, progress=progress, max_wait=max_wait)
+    except DataSourceError as e:
+        if stored is None or fresh_after is not None:
+            raise
+        report(logger, progress, WARNING,
+               f"Using stored data for {symbol} (last bar {stored['Date'].iloc[-1]:%Y-%m-%d}): {e.message}")
+        return stored
+
+    merged = store.merge(source, symbol, new_bars, stored)
+    if shared_cache is not None:
+        shared_cache.set(key, merged)
+    return merged
+
+
+async def fetch_many(symbols, source, api_key, concurrency=8, store=OHLCV_STORE, progress=None,
+                     on_result=None, max_wait=None, shared_cache=SHARED_CACHE, fresh_after=None):
+    """Load many symbols concurrently over the shared connection pool
+
+    Returns {symbol: DataFrame or exception}; one failing symbol never
+    cancels the others. on_result(symbol, data_or_exception), if given, is
+    called as each symbol completes, so callers can start work on it early.
+    Requests queue on the per-minute rate limit without a deadline by
+    default (max_wait=None), so only an exhausted daily quota fails them.
+    shared_cache and fresh_after are passed to load_stock_history.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = asyncio.Semaphore(concurrency)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        async def load(symbol):
+            async with semaphore:
+                task = partial(load_stock_history, source, symbol, api_key, store=store, progress=progress,
+                               shared_cache=shared_cache, max_wait=max_wait, fresh_after=fresh_after)
+                try:
+                    result = await loop.run_in_executor(executor, task)
+                except Exception as e:
+                    result = e
+                if on_result is not None:
+                    on_result(symbol, result)
+                return symbol, result
+
+        results = await asyncio.gather(*(load(symbol) for symbol in symbols))
+    return dict(results)
+
+
+def fetch_many_sync(symbols, source, api_key, concurrency=8, store=OHLCV_STORE, progress=None, on_result=None,
+                    max_wait=None, shared_cache=SHARED_CACHE, fresh_after=None):
+    """Blocking wrapper around fetch_many for scripts and worker processes"""
+    return asyncio.run(fetch_many(symbols, source, api_key, concurrency, store, progress, on_result, max_wait,
+                                  shared_cache, fresh_after))
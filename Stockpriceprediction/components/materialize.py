@@ -0,0 +1,242 @@
+"""
+Materialize Module
+Precomputes forecasts for the popular symbols after each market close and serves them to the app
+
+Each symbol is fitted once and forecast at the longest horizon the UI
+offers; shorter horizons are row slices of the same frame. Stored
+forecasts are served even when stale while a refresh runs in the
+background (stale-while-revalidate).
+
+Usage:
+    python -m Stockpriceprediction materialize --source fmp --api-key demo
+    python -m Stockpriceprediction materialize --daemon
+"""
+
+import logging
+import os
+import threading
+import time
+from datetime import datetime, time as clock_time, timedelta
+from functools import partial
+from zoneinfo import ZoneInfo
+
+import pandas as pd
+
+from . import batch, forecasting
+from .arrow_io import read_ipc_file, read_ipc_metadata, write_ipc_file
+from .config import FORECAST_STORE_DIR
+from .fileutil import safe_symbol
+from .progress import report, INFO, SUCCESS, WARNING
+from .stock_data import FORECAST_HORIZON_YEARS
+
+logger = logging.getLogger(__name__)
+
+# Longest horizon offered in the UI, in the app's days-per-year convention
+MAX_HORIZON_DAYS = int(max(FORECAST_HORIZON_YEARS) * 365)
+
+# Settings forecasts are materialized with: the app's default confidence and uncertainty mode
+MATERIALIZED_INTERVAL_WIDTH = 0.95
+MATERIALIZED_UNCERTAINTY_SAMPLES = forecasting.UNCERTAINTY_SAMPLES['balanced']
+
+MARKET_TIMEZONE = ZoneInfo('America/New_York')
+MARKET_CLOSE = clock_time(16, 0)
+# Providers publish the day's bar a little after the close
+PUBLISH_DELAY = timedelta(minutes=30)
+
+
+def last_market_close(now=None):
+    """Most recent weekday close (plus the publishing delay) at or before now
+
+    Exchange holidays are not modelled; a run on a holiday refits on
+    unchanged data, which only costs time.
+    """
+    now = (now or datetime.now(MARKET_TIMEZONE)).astimezone(MARKET_TIMEZONE)
+    close = datetime.combine(now.date(), MARKET_CLOSE, MARKET_TIMEZONE) + PUBLISH_DELAY
+    while close > now or close.weekday() >= 5:
+        close -= timedelta(days=1)
+    return close
+
+
+def next_market_close(now=None):
+    """First weekday close (plus the publishing delay) after now"""
+    close = last_market_close(now) + timedelta(days=1)
+    while close.weekday() >= 5:
+        close += timedelta(days=1)
+    return close
+
+
+class ForecastStore:
+    """Materialized forecasts, one Arrow IPC file per (source, symbol, model)
+
+    Files hold the compact forecast frame (history fit plus MAX_HORIZON_DAYS
+    future rows) with the settings and computation time in the schema
+    metadata, and are memory-mapped on load.
+    """
+
+    def __init__(self, root=FORECAST_STORE_DIR):
+        self.root = root
+
+    def _path(self, source, symbol, model_name):
+        return os.path.join(self.root, source, model_name, f"{safe_symbol(symbol)}.arrow")
+
+    def save(self, source, symbol, model_name, forecast, n_history, last_date, interval_width,
+             uncertainty_samples):
+        write_ipc_file(forecast, self._path(source, symbol, model_name), metadata={
+            'computed_at': repr(time.time()),
+            'last_date': pd.Timestamp(last_date).isoformat(),
+            'n_history': str(n_history),
+            'horizon_days': str(len(forecast) - n_history),
+            'interval_width': repr(float(interval_width)),
+            'uncertainty_samples': str(int(uncertainty_samples))
+        })
+
+    def metadata(self, source, symbol, model_name):
+        """Stored settings and timestamps, or None if nothing is stored"""
+        try:
+            raw = read_ipc_metadata(self._path(source, symbol, model_name))
+        except (FileNotFoundError, OSError):
+            return None
+        return {
+            'computed_at': float(raw['computed_at']),
+            'last_date': pd.Timestamp(raw['last_date']),
+            'n_history': int(raw['n_history']),
+            'horizon_days': int(raw['horizon_days']),
+            'interval_width': float(raw['interval_width']),
+            'uncertainty_samples': int(raw['uncertainty_samples'])
+        }
+
+    def load(self, source, symbol, model_name):
+        """(forecast, metadata) for a symbol, or None if nothing is stored"""
+        meta = self.metadata(source, symbol, model_name)
+        if meta is None:
+            return None
+        try:
+            return read_ipc_file(self._path(source, symbol, model_name)), meta
+        except (FileNotFoundError, OSError):
+            return None
+
+    @staticmethod
+    def is_stale(meta, now=None):
+        """True if the forecast was computed before the most recent market close"""
+        return meta['computed_at'] < last_market_close(now).timestamp()
+
+    def needs_refresh(self, source, symbol, model_name):
+        """True if nothing is stored for the symbol or the stored forecast is stale"""
+        meta = self.metadata(source, symbol, model_name)
+        return meta is None or self.is_stale(meta)
+
+
+def stored_forecast(source, symbol, model_name, period_days, interval_width, uncertainty_samples, store=None):
+    """Stored forecast sliced to period_days, as (forecast, metadata); None unless the settings match"""
+    store = store or FORECAST_STORE
+    stored = store.load(source, symbol, model_name)
+    if stored is None:
+        return None
+    forecast, meta = stored
+    if (round(meta['interval_width'], 4) != round(float(interval_width), 4)
+            or meta['uncertainty_samples'] != uncertainty_samples or meta['horizon_days'] < period_days):
+        return None
+    # Future rows are consecutive days after the history rows, as in the forecast cache
+    return forecast.iloc[:meta['n_history'] + period_days].reset_index(drop=True), meta
+
+
+def materialize_symbol(symbol, source, data, period_days=MAX_HORIZON_DAYS, model_name='prophet',
+                       interval_width=MATERIALIZED_INTERVAL_WIDTH,
+                       uncertainty_samples=MATERIALIZED_UNCERTAINTY_SAMPLES, store=None):
+    """Fit one symbol, forecast period_days and store the result; runs inside a worker process"""
+    store = store or FORECAST_STORE
+    result = {'symbol': symbol, 'source': source, 'model': model_name, 'horizon_days': period_days}
+    started = time.perf_counter()
+    try:
+        if data is None or data.empty:
+            raise ValueError("no data")
+
+        df_train = forecasting.prepare_training_frame(data)
+        model = forecasting.train_model(df_train, model_name=model_name, warm_start_key=symbol)
+        forecast = forecasting.generate_forecast(model, period_days, use_cache=False,
+                                                 interval_width=interval_width,
+                                                 uncertainty_samples=uncertainty_samples)
+        store.save(source, symbol, model_name, forecast, len(model.history), data['Date'].iloc[-1],
+                   interval_width, uncertainty_samples)
+
+        result.update(forecasting.extract_prediction_metrics(data, forecast))
+        result.update(last_date=data['Date'].iloc[-1], status='ok', error=None)
+    except Exception as e:
+        result.update(status='failed', error=str(e))
+    result['fit_seconds'] = round(time.perf_counter() - started, 3)
+    return result
+
+
+def materialize(source='fmp', api_key='demo', symbols=None, model_names=('prophet',), max_workers=None,
+                force=False, progress=None, store=None):
+    """Materialize forecasts for symbols (default: every POPULAR_STOCKS symbol the source serves)
+
+    Symbols whose stored forecasts are all newer than the last market
+    close are skipped unless force is set. History is refetched unless it
+    was fetched after that close, so an intraday snapshot cached earlier in
+    the day is never materialized. Returns the batch result table.
+    """
+    store = store or FORECAST_STORE
+    symbols = list(symbols or batch.default_symbols(source))
+    if not force:
+        symbols = [symbol for symbol in symbols
+                   if any(store.needs_refresh(source, symbol, model_name) for model_name in model_names)]
+    if not symbols:
+        report(logger, progress, SUCCESS, "All materialized forecasts are up to date")
+        return batch.results_frame([])
+
+    fresh_after = last_market_close().timestamp()
+    tables = []
+    for model_name in model_names:
+        report(logger, progress, INFO, f"Materializing {len(symbols)} {model_name} forecasts "
+                                       f"({MAX_HORIZON_DAYS} days)...")
+        tables.append(batch.run_batch(symbols, source, api_key, MAX_HORIZON_DAYS / 365, max_workers,
+                                      model_name=model_name, worker=partial(materialize_symbol, store=store),
+                                      fresh_after=fresh_after))
+    results = pd.concat(tables, ignore_index=True)
+    failed = int((results['status'] != 'ok').sum())
+    report(logger, progress, SUCCESS,
+           f"Materialized {len(results) - failed} forecasts" + (f", {failed} failed" if failed else ""))
+    return results
+
+
+def run_scheduler(source='fmp', api_key='demo', symbols=None, model_names=('prophet',), max_workers=None,
+                  progress=None, store=None):
+    """Materialize now, then again after every market close; runs until interrupted"""
+    while True:
+        try:
+            materialize(source, api_key, symbols, model_names, max_workers, progress=progress, store=store)
+        except Exception as e:
+            report(logger, progress, WARNING, f"Materialization run failed: {e}")
+        wake = next_market_close()
+        report(logger, progress, INFO, f"Next materialization at {wake:%Y-%m-%d %H:%M %Z}")
+        time.sleep(max((wake - datetime.now(MARKET_TIMEZONE)).total_seconds(), 0))
+
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+
+
+def refresh_in_background(source, symbol, data, model_name='prophet', store=None):
+    """Re-materialize one symbol on a daemon thread; returns False if a refresh is already running"""
+    key = (source, symbol, model_name)
+    with _refreshing_lock:
+        if key in _refreshing:
+            return False
+        _refreshing.add(key)
+
+    def run():
+        try:
+            result = materialize_symbol(symbol, source, data, model_name=model_name, store=store)
+            if result['status'] != 'ok':
+                logger.warning("Background refresh of %s failed: %s", symbol, result['error'])
+        finally:
+            with _refreshing_lock:
+                _refreshing.discard(key)
+
+    threading.Thread(target=run, name=f"materialize-{symbol}", daemon=True).start()
+    return True
+
+
+# Shared instance used by the app and the scheduler
+FORECAST_STORE = ForecastStore()
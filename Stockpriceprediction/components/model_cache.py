@@ -0,0 +1,136 @@
+"""
+Model Cache Module
+Persists fitted Prophet models on disk so unchanged data is never refit
+"""
+
+import os
+import json
+import hashlib
+import threading
+from importlib import metadata
+
+import numpy as np
+
+from .config import MODEL_CACHE_DIR, MODEL_CACHE_MAX_BYTES, MODEL_CACHE_MAX_ENTRIES
+from .fileutil import atomic_write, safe_symbol
+
+
+def _prophet_version():
+    # Read from package metadata so hashing never imports prophet itself
+    try:
+        return metadata.version('prophet')
+    except metadata.PackageNotFoundError:
+        return ''
+
+
+class ModelCache:
+    """Content-addressed store of serialized Prophet models with LRU eviction"""
+
+    def __init__(self, cache_dir=MODEL_CACHE_DIR, max_bytes=MODEL_CACHE_MAX_BYTES,
+                 max_entries=MODEL_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(df_train, params):
+        """Hash the ds/y training frame together with the model hyperparameters"""
+        digest = hashlib.sha256()
+        ds = df_train['ds'].to_numpy(dtype='datetime64[ns]').astype(np.int64)
+        y = df_train['y'].to_numpy(dtype=np.float64)
+        digest.update(np.ascontiguousarray(ds).tobytes())
+        digest.update(np.ascontiguousarray(y).tobytes())
+        digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+        digest.update(_prophet_version().encode())
+        return digest.hexdigest()
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.json")
+
+    def get(self, key):
+        """Return the cached model for key, or None on a miss"""
+        from prophet.serialize import model_from_json
+
+        path = self._path(key)
+        try:
+            with open(path, 'r') as fin:
+                model = model_from_json(fin.read())
+        except (OSError, ValueError):
+            return None
+
+        # Touch the file so eviction treats it as recently used
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return model
+
+    def put(self, key, model):
+        """Serialize a fitted model under key and evict old entries"""
+        from prophet.serialize import model_to_json
+
+        with atomic_write(self._path(key), 'w') as fout:
+            fout.write(model_to_json(model))
+        self.evict()
+
+    def evict(self):
+        """Drop least recently used models until size and count limits hold"""
+        with self._lock:
+            try:
+                names = [n for n in os.listdir(self.cache_dir) if n.endswith('.json')]
+            except OSError:
+                return
+
+            entries = []
+            for name in names:
+                try:
+                    stat = os.stat(os.path.join(self.cache_dir, name))
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, name))
+            entries.sort()
+
+            total_bytes = sum(size for _, size, _ in entries)
+            while entries and (total_bytes > self.max_bytes or len(entries) > self.max_entries):
+                _, size, name = entries.pop(0)
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
+                total_bytes -= size
+
+    def _warm_start_path(self, symbol):
+        return os.path.join(self.cache_dir, 'warm_start', f"{safe_symbol(symbol)}.json")
+
+    def save_warm_start(self, symbol, model):
+        """Remember a fitted model's optimizer parameters as the next refit's starting point"""
+        params = {name: np.asarray(model.params[name][0]).tolist()
+                  for name in ('k', 'm', 'sigma_obs', 'delta', 'beta')}
+        with atomic_write(self._warm_start_path(symbol), 'w') as fout:
+            json.dump(params, fout)
+
+    def load_warm_start(self, symbol):
+        """Return Stan initial values (k, m, sigma_obs, delta, beta) from the symbol's last fit"""
+        try:
+            with open(self._warm_start_path(symbol), 'r') as fin:
+                params = json.load(fin)
+        except (OSError, ValueError):
+            return None
+
+        init = {name: float(np.ravel(params[name])[0]) for name in ('k', 'm', 'sigma_obs')}
+        init.update({name: np.asarray(params[name], dtype=np.float64) for name in ('delta', 'beta')})
+        return init
+
+    def clear(self):
+        """Remove every cached model"""
+        with self._lock:
+            if not os.path.isdir(self.cache_dir):
+                return
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.cache_dir, name))
+
+
+# Shared instance used by the prediction engine
+MODEL_CACHE = ModelCache()
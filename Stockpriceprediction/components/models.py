@@ -0,0 +1,106 @@
+"""
+Models Module
+Closed-form forecasting backends that share Prophet's fit/predict interface
+"""
+
+from abc import ABC, abstractmethod
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+
+class ForecastModel(ABC):
+    """Interface every forecasting backend implements (Prophet satisfies it as-is)
+
+    fit(df) takes a ds/y frame, make_future_dataframe(periods) returns the
+    history dates plus `periods` daily dates, and predict(future) returns a
+    frame with ds, trend, yhat, yhat_lower and yhat_upper. interval_width
+    and uncertainty_samples are read at predict time.
+    """
+
+    def __init__(self, interval_width=0.80):
+        self.interval_width = interval_width
+        self.uncertainty_samples = 0
+        self.history = None
+
+    @abstractmethod
+    def fit(self, df):
+        """Fit the model to a ds/y frame and return self"""
+
+    @abstractmethod
+    def predict(self, future):
+        """Frame with ds, trend, yhat, yhat_lower and yhat_upper for the dates in future"""
+
+    def make_future_dataframe(self, periods, include_history=True):
+        if self.history is None:
+            raise ValueError("Model has not been fit.")
+        last_date = self.history['ds'].iloc[-1]
+        dates = pd.date_range(start=last_date + pd.Timedelta(days=1), periods=periods, freq='D')
+        if include_history:
+            dates = pd.DatetimeIndex(self.history['ds']).append(dates)
+        return pd.DataFrame({'ds': dates})
+
+
+class LinearTrendModel(ForecastModel):
+    """Ordinary least squares straight line with an analytic prediction interval"""
+
+    def _transform(self, y):
+        return y
+
+    def _inverse(self, y):
+        return y
+
+    def _days(self, ds):
+        return ((pd.DatetimeIndex(ds) - self._start) / pd.Timedelta(days=1)).to_numpy(dtype=np.float64)
+
+    def fit(self, df):
+        self.history = df[['ds', 'y']].reset_index(drop=True)
+        self._start = self.history['ds'].iloc[0]
+        x = self._days(self.history['ds'])
+        y = self._transform(self.history['y'].to_numpy(dtype=np.float64))
+
+        n = len(x)
+        if n < 3:
+            raise ValueError("At least 3 observations are required.")
+        x_mean = x.mean()
+        x_centered = x - x_mean
+        sxx = np.dot(x_centered, x_centered)
+        if sxx == 0:
+            raise ValueError("Observations must span more than one date.")
+
+        self.slope = np.dot(x_centered, y - y.mean()) / sxx
+        self.intercept = y.mean() - self.slope * x_mean
+        residuals = y - (self.intercept + self.slope * x)
+        self.sigma = np.sqrt(np.dot(residuals, residuals) / (n - 2))
+        self._n, self._x_mean, self._sxx = n, x_mean, sxx
+        return self
+
+    def predict(self, future):
+        x = self._days(future['ds'])
+        fitted = self.intercept + self.slope * x
+
+        # Normal quantile in place of Student's t; fits always use 30+ points
+        z = NormalDist().inv_cdf(0.5 + self.interval_width / 2)
+        se = self.sigma * np.sqrt(1 + 1 / self._n + (x - self._x_mean) ** 2 / self._sxx)
+
+        yhat = self._inverse(fitted)
+        return pd.DataFrame({
+            'ds': pd.DatetimeIndex(future['ds']),
+            'trend': yhat,
+            'yhat_lower': self._inverse(fitted - z * se),
+            'yhat_upper': self._inverse(fitted + z * se),
+            'yhat': yhat
+        })
+
+
+class ExponentialGrowthModel(LinearTrendModel):
+    """Constant growth rate: a straight line fitted to log prices"""
+
+    def _transform(self, y):
+        if (y <= 0).any():
+            raise ValueError("Exponential growth requires strictly positive prices.")
+        return np.log(y)
+
+    def _inverse(self, y):
+        return np.exp(y)
@@ -0,0 +1,120 @@
+"""
+OHLCV Store Module
+Persists per-symbol daily price history on disk between app restarts
+"""
+
+import os
+import time
+from datetime import date
+
+import numpy as np
+import pandas as pd
+
+from .arrow_io import read_ipc_file, write_ipc_file
+from .config import OHLCV_STORE_DIR, OHLCV_STORE_FORMAT, OHLCV_REFRESH_SECONDS
+from .fileutil import atomic_write, safe_symbol
+
+OHLCV_COLUMNS = ['Date', 'Open', 'High', 'Low', 'Close', 'Volume']
+
+# File extension per storage format
+STORE_FORMATS = {'arrow': '.arrow', 'parquet': '.parquet'}
+
+
+class OHLCVStore:
+    """On-disk history store, one file per (source, symbol)
+
+    The 'arrow' format writes uncompressed Arrow IPC files that load() memory
+    maps, so the returned frame's columns are read-only views of the OS page
+    cache rather than private copies; 'parquet' files are smaller but are
+    decoded into memory on every load. Files in the other format are still
+    read, and are converted the next time the symbol is saved.
+    """
+
+    def __init__(self, root=OHLCV_STORE_DIR, refresh_seconds=OHLCV_REFRESH_SECONDS, fmt=OHLCV_STORE_FORMAT):
+        if fmt not in STORE_FORMATS:
+            raise ValueError(f"Unknown OHLCV store format: {fmt}")
+        self.root = root
+        self.refresh_seconds = refresh_seconds
+        self.fmt = fmt
+
+    def _path(self, source, symbol, fmt=None):
+        return os.path.join(self.root, source, f"{safe_symbol(symbol)}{STORE_FORMATS[fmt or self.fmt]}")
+
+    def _existing_path(self, source, symbol):
+        """Path of the stored file, preferring the configured format; None if nothing is stored"""
+        for fmt in [self.fmt] + [other for other in STORE_FORMATS if other != self.fmt]:
+            path = self._path(source, symbol, fmt)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def load(self, source, symbol):
+        """Return the stored history for a symbol, or None if nothing is stored"""
+        path = self._existing_path(source, symbol)
+        if path is None:
+            return None
+        try:
+            if path.endswith(STORE_FORMATS['arrow']):
+                return read_ipc_file(path)
+            return pd.read_parquet(path)
+        except Exception:
+            return None
+
+    def save(self, source, symbol, df):
+        """Atomically replace the stored history for a symbol"""
+        path = self._path(source, symbol)
+        if self.fmt == 'arrow':
+            write_ipc_file(df[OHLCV_COLUMNS], path)
+        else:
+            with atomic_write(path) as f:
+                df[OHLCV_COLUMNS].to_parquet(f, index=False)
+
+        # Drop a copy left in the other format so load() never sees stale bars
+        for fmt in STORE_FORMATS:
+            if fmt != self.fmt and os.path.exists(self._path(source, symbol, fmt)):
+                os.remove(self._path(source, symbol, fmt))
+
+    def merge(self, source, symbol, new_bars, stored=None):
+        """Append newly fetched bars to the stored history and persist the result"""
+        if stored is None:
+            stored = self.load(source, symbol)
+        if stored is None or stored.empty:
+            combined = new_bars
+        else:
+            # Newer bars win so that late revisions from the provider replace old values
+            combined = pd.concat([stored, new_bars], ignore_index=True)
+            combined = combined.drop_duplicates(subset='Date', keep='last')
+
+        combined = combined.sort_values('Date').reset_index(drop=True)
+        self.save(source, symbol, combined)
+        if self.fmt == 'arrow':
+            # Hand back the mapped file so callers do not keep a private copy
+            mapped = self.load(source, symbol)
+            if mapped is not None:
+                return mapped
+        return combined
+
+    def is_fresh(self, source, symbol, fresh_after=None):
+        """True if the symbol was refreshed recently enough to skip the network
+
+        With fresh_after (a POSIX timestamp), only a refresh at or after that
+        time counts, whatever refresh_seconds allows.
+        """
+        try:
+            refreshed_at = os.path.getmtime(self._existing_path(source, symbol))
+        except (OSError, TypeError):
+            return False
+        if fresh_after is not None:
+            return refreshed_at >= fresh_after
+        return time.time() - refreshed_at < self.refresh_seconds
+
+    @staticmethod
+    def missing_trading_days(stored):
+        """Approximate number of weekday bars between the last stored bar and today"""
+        last_date = np.datetime64(pd.Timestamp(stored['Date'].iloc[-1]).date(), 'D')
+        today = np.datetime64(date.today(), 'D')
+        return int(np.busday_count(last_date + 1, today + 1))
+
+
+# Shared instance used by the data sources
+OHLCV_STORE = OHLCVStore()
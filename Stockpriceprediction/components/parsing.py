@@ -0,0 +1,101 @@
+"""
+Parsing Module
+Columnar conversion of provider JSON payloads into OHLCV DataFrames
+"""
+
+import numpy as np
+import pandas as pd
+
+# Output column -> provider field name
+ALPHA_VANTAGE_FIELDS = {
+    'Open': '1. open',
+    'High': '2. high',
+    'Low': '3. low',
+    'Close': '4. close',
+    'Volume': '5. volume'
+}
+
+FMP_FIELDS = {
+    'Open': 'open',
+    'High': 'high',
+    'Low': 'low',
+    'Close': 'close',
+    'Volume': 'volume'
+}
+
+IEX_FIELDS = FMP_FIELDS
+
+
+def _date_column(values):
+    """Bulk-convert ISO date strings to datetime64[ns]"""
+    try:
+        return np.array(values, dtype='datetime64[D]').astype('datetime64[ns]')
+    except ValueError:
+        # Timestamps with a time component or unusual formats
+        return pd.to_datetime(pd.Index(values)).to_numpy(dtype='datetime64[ns]')
+
+
+def _float_column(values):
+    """Bulk-convert numbers or numeric strings to float64 (invalid entries become NaN)"""
+    try:
+        return np.array(values, dtype=np.float64)
+    except (TypeError, ValueError):
+        return pd.to_numeric(pd.Series(values, dtype=object), errors='coerce').to_numpy(dtype=np.float64)
+
+
+def date_order(date_values):
+    """Indexer that puts date_values in ascending order, or None if they already are
+
+    Input is usually either oldest-first or newest-first, so a linear scan
+    replaces the full sort in the common cases.
+    """
+    if len(date_values) < 2:
+        return None
+    steps = np.diff(date_values.view(np.int64))
+    if (steps >= 0).all():
+        return None
+    if (steps < 0).all():
+        return slice(None, None, -1)
+    return np.argsort(date_values, kind='stable')
+
+
+def build_ohlcv_frame(dates, columns):
+    """Assemble a date-sorted OHLCV DataFrame from raw column lists"""
+    date_values = _date_column(dates)
+    data = {name: _float_column(values) for name, values in columns.items()}
+    data['Volume'] = np.nan_to_num(data['Volume'], nan=0.0).astype(np.int64)
+
+    frame = {'Date': date_values}
+    frame.update(data)
+    order = date_order(date_values)
+    if order is not None:
+        frame = {name: values[order] for name, values in frame.items()}
+
+    return pd.DataFrame(frame, columns=['Date', 'Open', 'High', 'Low', 'Close', 'Volume'])
+
+
+def parse_alpha_vantage(time_series):
+    """Parse the 'Time Series (Daily)' mapping of an Alpha Vantage response"""
+    rows = list(time_series.values())
+    columns = {name: [row[field] for row in rows] for name, field in ALPHA_VANTAGE_FIELDS.items()}
+    return build_ohlcv_frame(list(time_series.keys()), columns)
+
+
+def parse_fmp(historical):
+    """Parse the 'historical' list of a Financial Modeling Prep response"""
+    columns = {name: [row[field] for row in historical] for name, field in FMP_FIELDS.items()}
+    return build_ohlcv_frame([row['date'] for row in historical], columns)
+
+
+def parse_iex(records):
+    """Parse an IEX Cloud chart response, dropping incomplete or null-close rows"""
+    required = ('date',) + tuple(IEX_FIELDS.values())
+    rows = [row for row in records if all(key in row for key in required)]
+    columns = {name: [row[field] for row in rows] for name, field in IEX_FIELDS.items()}
+    df = build_ohlcv_frame([row['date'] for row in rows], columns)
+
+    close = df['Close'].to_numpy()
+    valid = ~np.isnan(close) & (close != 0)
+    if not valid.all():
+        df = df[valid].reset_index(drop=True)
+    return df
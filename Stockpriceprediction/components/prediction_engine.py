@@ -5,7 +5,12 @@ Handles Prophet model training and forecasting logic
 
 import streamlit as st
 import pandas as pd
-from prophet import Prophet
+import time
+from . import batch, forecasting, jobs, materialize
+from .config import JOB_POLL_SECONDS
+from .model_cache import MODEL_CACHE
+from .exceptions import StockProphetError
+from .st_feedback import show_progress, show_error
 
 class PredictionEngine:
     """Centralized prediction engine using Facebook Prophet"""
@@ -13,57 +18,127 @@ class PredictionEngine:
     @staticmethod
     def prepare_data_for_prophet(data):
         """Prepare data for Prophet model training"""
-        df_train = data[['Date', 'Close']].copy()
-        df_train = df_train.rename(columns={"Date": "ds", "Close": "y"})
-        df_train = df_train.dropna()
-        
-        if len(df_train) < 30:
-            st.error("❌ Insufficient data for prediction. Need at least 30 data points.")
+        try:
+            return forecasting.prepare_training_frame(data)
+        except StockProphetError as e:
+            show_error(e)
             st.stop()
-        
-        return df_train
 
     @staticmethod
-    def train_prophet_model(df_train):
-        """Train Prophet model with progress indicator"""
-        with st.spinner("🧠 Training Prophet model... This may take a moment."):
+    def train_prophet_model(df_train, use_cache=True):
+        """Train Prophet model with progress indicator, reusing cached fits"""
+        return PredictionEngine.train_model(df_train, 'prophet', use_cache)
+
+    @staticmethod
+    def train_model(df_train, model_name='prophet', use_cache=True, warm_start_key=None):
+        """Train any registered backend ('prophet', 'linear', 'exponential') with progress indicator"""
+        label = forecasting.MODEL_BACKENDS[model_name]['label']
+        with st.spinner(f"🧠 Training {label} model... This may take a moment."):
             try:
-                m = Prophet(
-                    daily_seasonality=False,
-                    weekly_seasonality=True,
-                    yearly_seasonality=True,
-                    seasonality_mode='additive'
-                )
-                m.fit(df_train)
-                
-                st.success("✅ Model training completed!")
-                return m
-                
-            except Exception as e:
-                st.error(f"❌ Model training failed: {str(e)}")
+                return forecasting.train_model(df_train, use_cache=use_cache, progress=show_progress,
+                                               model_name=model_name, warm_start_key=warm_start_key)
+            except StockProphetError as e:
+                show_error(e)
                 st.stop()
 
     @staticmethod
-    def generate_forecast(model, period_days):
-        """Generate forecast for specified period"""
+    def generate_forecast(model, period_days, interval_width=None, uncertainty_samples=None):
+        """Generate forecast for specified period (uncertainty_samples=0 uses the fast analytic interval)"""
+        try:
+            return forecasting.generate_forecast(model, period_days, interval_width=interval_width,
+                                                 uncertainty_samples=uncertainty_samples)
+        except StockProphetError as e:
+            show_error(e)
+            st.stop()
+
+    @staticmethod
+    @st.cache_data(show_spinner=False)
+    def forecast_symbols(partitions, n_years, model_name='prophet', interval_width=None, uncertainty_samples=None):
+        """Forecast every {symbol: OHLCV frame} partition in parallel; returns one row per symbol"""
+        progress_bar = st.progress(0.0, text=f"🧠 Forecasting {len(partitions)} symbols...")
+        completed = []
+
+        def update(result):
+            completed.append(result['symbol'])
+            progress_bar.progress(len(completed) / len(partitions),
+                                  text=f"🧠 {result['symbol']} done ({len(completed)}/{len(partitions)})")
+
+        results = batch.forecast_frames(partitions, n_years, progress=update, model_name=model_name,
+                                        interval_width=interval_width, uncertainty_samples=uncertainty_samples)
+        progress_bar.empty()
+        return results
+
+    @staticmethod
+    @st.cache_resource
+    def job_queue():
+        """Forecast job queue shared by every session of this server process"""
+        return jobs.JobQueue()
+
+    @staticmethod
+    def submit_forecast(data, df_train, n_years, model_name='prophet', interval_width=None,
+                        uncertainty_samples=None, warm_start_key=None):
+        """Queue a fit + forecast; identical requests from other sessions share the same job"""
+        params = forecasting.MODEL_BACKENDS[model_name]['params']
+        key = ('forecast', MODEL_CACHE.make_key(df_train, params), model_name, int(n_years * 365),
+               interval_width, uncertainty_samples)
+        return PredictionEngine.job_queue().submit(
+            key, forecasting.run_forecast, data, n_years, model_name=model_name, interval_width=interval_width,
+            uncertainty_samples=uncertainty_samples, warm_start_key=warm_start_key)
+
+    @staticmethod
+    @st.fragment(run_every=JOB_POLL_SECONDS)
+    def render_job_status(job_id):
+        """Poll a queued forecast without blocking the session; reruns the app once it has finished"""
+        status = PredictionEngine.job_queue().status(job_id)
+        if status is None or status['status'] in (jobs.DONE, jobs.FAILED):
+            st.rerun()
+        if status['status'] == jobs.QUEUED:
+            st.info(f"⏳ Waiting for a free worker... ({status['elapsed']:.0f}s)")
+        else:
+            st.info(f"🧠 Training model in the background... ({status['elapsed']:.0f}s)")
+
+    @staticmethod
+    def job_result(job):
+        """(model, forecast) of a finished forecast job; a failed job is shown with a Retry button"""
         try:
-            future = model.make_future_dataframe(periods=period_days)
-            forecast = model.predict(future)
-            return forecast
-            
+            model, forecast, _ = job.result()
+            return model, forecast
         except Exception as e:
-            st.error(f"❌ Forecast generation failed: {str(e)}")
+            if isinstance(e, StockProphetError):
+                show_error(e)
+            else:
+                st.error(f"❌ Forecast failed: {e}")
+            # The failed job stays queued under its key, so reruns show this error instead of refitting
+            if st.button("🔄 Retry", key=f"retry_{job.id}"):
+                PredictionEngine.job_queue().forget(job.id)
+                st.rerun()
             st.stop()
 
+    @staticmethod
+    def load_materialized_forecast(source, symbol, data, model_name, period_days, interval_width,
+                                   uncertainty_samples):
+        """Serve a precomputed forecast if one matches the settings, refreshing it in the background when stale"""
+        stored = materialize.stored_forecast(source, symbol, model_name, period_days, interval_width,
+                                             uncertainty_samples)
+        if stored is None:
+            return None
+
+        forecast, meta = stored
+        age_minutes = max(time.time() - meta['computed_at'], 0) / 60
+        if age_minutes < 60:
+            age = f"{age_minutes:.0f} min"
+        elif age_minutes < 48 * 60:
+            age = f"{age_minutes / 60:.0f} h"
+        else:
+            age = f"{age_minutes / (24 * 60):.0f} days"
+        message = f"⚡ Precomputed forecast (data through {meta['last_date']:%Y-%m-%d}, computed {age} ago)"
+        if materialize.FORECAST_STORE.is_stale(meta):
+            materialize.refresh_in_background(source, symbol, data, model_name)
+            message += " - refreshing in the background"
+        st.caption(message)
+        return forecast
+
     @staticmethod
     def extract_prediction_metrics(data, forecast):
         """Extract key prediction metrics"""
-        current_price = data['Close'].iloc[-1]
-        future_price = forecast['yhat'].iloc[-1]
-        
-        return {
-            'current_price': current_price,
-            'future_price': future_price,
-            'price_change': future_price - current_price,
-            'price_change_pct': ((future_price - current_price) / current_price) * 100
-        } 
\ No newline at end of file
+        return forecasting.extract_prediction_metrics(data, forecast)
\ No newline at end of file
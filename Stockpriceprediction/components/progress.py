@@ -0,0 +1,27 @@
+"""
+Progress Module
+Logging and optional progress callbacks for the Streamlit-free core layer
+"""
+
+import logging
+
+# Levels understood by progress callbacks
+INFO = 'info'
+SUCCESS = 'success'
+WARNING = 'warning'
+
+_LOG_LEVELS = {
+    INFO: logging.INFO,
+    SUCCESS: logging.INFO,
+    WARNING: logging.WARNING,
+}
+
+
+def report(logger, progress, level, message):
+    """Log a progress message and forward it to the caller's callback, if any
+
+    Callbacks take (level, message) where level is 'info', 'success' or 'warning'.
+    """
+    logger.log(_LOG_LEVELS.get(level, logging.INFO), message)
+    if progress is not None:
+        progress(level, message)
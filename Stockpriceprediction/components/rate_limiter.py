@@ -0,0 +1,195 @@
+"""
+Rate Limiter Module
+Per-provider token buckets and a persistent daily quota tracker
+"""
+
+import json
+import time
+import hashlib
+import threading
+from datetime import datetime, timezone
+
+from .config import QUOTA_FILE, RATE_LIMIT_MAX_WAIT
+from .exceptions import APILimitError
+from .fileutil import atomic_write
+from .locks import FileLock
+from .stock_data import API_RATE_LIMITS
+
+
+# Default for RateLimiter.acquire: wait at most the limiter's max_wait (None waits without a deadline)
+DEFAULT_WAIT = object()
+
+
+class QuotaExceededError(APILimitError):
+    """No daily budget is left for this provider and key"""
+
+
+class TokenBucket:
+    """Classic token bucket: `capacity` burst, refilled at `rate` tokens per second"""
+
+    def __init__(self, rate, capacity):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now):
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self):
+        """Take a token if one is available; otherwise return seconds until the next one"""
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def reserve(self, max_wait=None):
+        """Claim the next token; seconds until it may be used, or None if that exceeds max_wait
+
+        Tokens may be claimed ahead of the refill (the balance goes
+        negative), so waiters are served in the order they reserved.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._refill(now)
+            wait = max(0.0, (1 - self._tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                return None
+            self._tokens -= 1
+            return wait
+
+    def acquire(self, max_wait=None):
+        """Block until a token is available (FIFO); False if that would take longer than max_wait"""
+        wait = self.reserve(max_wait)
+        if wait is None:
+            return False
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+
+class QuotaTracker:
+    """Counts requests per (provider, key) per UTC day in a JSON file shared by all processes"""
+
+    def __init__(self, path=QUOTA_FILE):
+        self.path = path
+        self._lock = FileLock(path + '.lock')
+
+    @staticmethod
+    def _today():
+        return datetime.now(timezone.utc).strftime("%Y-%m-%d")
+
+    def _read(self):
+        try:
+            with open(self.path, 'r') as fin:
+                return json.load(fin)
+        except (OSError, ValueError):
+            return {}
+
+    def _write(self, state):
+        with atomic_write(self.path, 'w') as fout:
+            json.dump(state, fout)
+
+    def used(self, key):
+        entry = self._read().get(key)
+        if not entry or entry.get('date') != self._today():
+            return 0
+        return entry['used']
+
+    def consume(self, key, limit):
+        """Record one request; False (nothing recorded) if the daily limit is reached"""
+        with self._lock:
+            state = self._read()
+            today = self._today()
+            entry = state.get(key)
+            if not entry or entry.get('date') != today:
+                entry = {'date': today, 'used': 0}
+            if limit is not None and entry['used'] >= limit:
+                return False
+            entry['used'] += 1
+            state[key] = entry
+            self._write(state)
+            return True
+
+    def exhaust(self, key, limit):
+        """Mark the day's budget as spent (the provider told us so)"""
+        with self._lock:
+            state = self._read()
+            state[key] = {'date': self._today(), 'used': max(limit or 0, self.used(key))}
+            self._write(state)
+
+
+class RateLimiter:
+    """Gatekeeper for provider requests: daily quota first, then the per-minute token bucket"""
+
+    def __init__(self, limits=API_RATE_LIMITS, quota=None, max_wait=RATE_LIMIT_MAX_WAIT):
+        self.limits = limits
+        self.quota = quota or QuotaTracker()
+        self.max_wait = max_wait
+        self._buckets = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(provider, api_key):
+        # Quotas belong to API keys; store a digest rather than the key itself
+        digest = hashlib.sha256((api_key or '').encode()).hexdigest()[:12]
+        return f"{provider}:{digest}"
+
+    def _bucket(self, key, per_minute):
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = TokenBucket(per_minute / 60.0, per_minute)
+                self._buckets[key] = bucket
+            return bucket
+
+    @staticmethod
+    def _quota_error(provider, limits):
+        return QuotaExceededError(
+            f"Daily request quota of {limits['per_day']} used up for this API key", source=provider,
+            hint="Stored data is used where available; the quota resets at midnight UTC.")
+
+    def remaining(self, provider, api_key):
+        """Requests left today for this provider and key (None if unlimited)"""
+        per_day = self.limits.get(provider, {}).get('per_day')
+        if per_day is None:
+            return None
+        return max(0, per_day - self.quota.used(self._key(provider, api_key)))
+
+    def acquire(self, provider, api_key, max_wait=DEFAULT_WAIT):
+        """Wait for permission to send one request, or raise APILimitError
+
+        Interactive callers wait at most max_wait seconds for the per-minute
+        limit; batch and background callers pass max_wait=None to queue
+        until a token is free and fail only once the daily quota is used up.
+        """
+        limits = self.limits.get(provider)
+        if not limits:
+            return
+        key = self._key(provider, api_key)
+        if max_wait is DEFAULT_WAIT:
+            max_wait = self.max_wait
+
+        if self.remaining(provider, api_key) == 0:
+            raise self._quota_error(provider, limits)
+
+        per_minute = limits.get('per_minute')
+        if per_minute and not self._bucket(key, per_minute).acquire(max_wait):
+            raise APILimitError(f"Rate limit of {per_minute} requests/minute reached", source=provider,
+                                hint="Please wait a minute and try again.")
+
+        if not self.quota.consume(key, limits.get('per_day')):
+            raise self._quota_error(provider, limits)
+
+    def exhaust(self, provider, api_key):
+        """Record that the provider reported the quota as exhausted"""
+        self.quota.exhaust(self._key(provider, api_key), self.limits.get(provider, {}).get('per_day'))
+
+
+# Shared instance used by the data fetchers
+RATE_LIMITER = RateLimiter()
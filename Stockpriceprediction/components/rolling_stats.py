@@ -0,0 +1,170 @@
+"""
+Rolling Stats Module
+Trailing-window price statistics (52-week range, period returns, volatility) updated in O(1) per bar
+
+Usage:
+    stats = RollingWindowStats.from_frame(data)
+    stats.append(date, high, low, close)
+    stats.high, stats.low, stats.period_return('1M'), stats.volatility
+"""
+
+import math
+import threading
+from collections import OrderedDict, deque
+
+import numpy as np
+
+from .config import INDICATOR_CACHE_MAX_ENTRIES
+
+# Trading days in a year; the window for the 52-week range and volatility
+TRADING_DAYS_52W = 252
+
+# Trading days spanned by each reported period return
+RETURN_PERIODS = {'1W': 5, '1M': 21, '3M': 63, '6M': 126, '1Y': 252}
+
+
+class RollingWindowStats:
+    """Sliding max/min, returns and volatility over the last `window` bars
+
+    High and low use monotonic deques of (bar number, value): each bar is
+    pushed and popped at most once, so append is amortized O(1). Closes live
+    in a ring buffer for period returns, and volatility comes from running
+    sums of daily log returns.
+    """
+
+    def __init__(self, window=TRADING_DAYS_52W):
+        self.window = window
+        self.count = 0
+        self.last_date = None
+        self._highs = deque()
+        self._lows = deque()
+        # Holds window + 1 closes, enough for `window` returns and the 1Y period return
+        self._closes = np.full(max(window, max(RETURN_PERIODS.values())) + 1, np.nan)
+        self._log_returns = deque()
+        self._sum = 0.0
+        self._sum_sq = 0.0
+
+    @classmethod
+    def from_frame(cls, data, window=TRADING_DAYS_52W):
+        """Tracker seeded from the last bars of a Date/High/Low/Close frame (O(window))"""
+        stats = cls(window)
+        stats.extend(data.iloc[-len(stats._closes):])
+        return stats
+
+    def extend(self, data):
+        """Append the bars of a frame that are newer than the last bar seen"""
+        dates = data['Date'].to_numpy()
+        start = 0 if self.last_date is None else int(np.searchsorted(dates, self.last_date, side='right'))
+        highs = data['High'].to_numpy(dtype=np.float64)
+        lows = data['Low'].to_numpy(dtype=np.float64)
+        closes = data['Close'].to_numpy(dtype=np.float64)
+        for i in range(start, len(dates)):
+            self.append(dates[i], highs[i], lows[i], closes[i])
+        return self
+
+    def append(self, date, high, low, close):
+        """Add one bar and drop the bar that leaves the window"""
+        n = self.count
+        expired = n - self.window
+
+        while self._highs and self._highs[-1][1] <= high:
+            self._highs.pop()
+        self._highs.append((n, high))
+        if self._highs[0][0] <= expired:
+            self._highs.popleft()
+
+        while self._lows and self._lows[-1][1] >= low:
+            self._lows.pop()
+        self._lows.append((n, low))
+        if self._lows[0][0] <= expired:
+            self._lows.popleft()
+
+        if n > 0:
+            previous = self._closes[(n - 1) % len(self._closes)]
+            log_return = math.log(close / previous) if previous > 0 and close > 0 else 0.0
+            self._log_returns.append(log_return)
+            self._sum += log_return
+            self._sum_sq += log_return * log_return
+            if len(self._log_returns) > self.window:
+                dropped = self._log_returns.popleft()
+                self._sum -= dropped
+                self._sum_sq -= dropped * dropped
+
+        self._closes[n % len(self._closes)] = close
+        self.count = n + 1
+        self.last_date = date
+
+    @property
+    def high(self):
+        """Highest high of the window (the 52-week high by default)"""
+        return self._highs[0][1] if self._highs else np.nan
+
+    @property
+    def low(self):
+        """Lowest low of the window (the 52-week low by default)"""
+        return self._lows[0][1] if self._lows else np.nan
+
+    @property
+    def close(self):
+        return self._closes[(self.count - 1) % len(self._closes)] if self.count else np.nan
+
+    def period_return(self, period):
+        """Fractional return over a RETURN_PERIODS key or a number of bars; NaN if history is too short"""
+        bars = RETURN_PERIODS.get(period, period)
+        if bars >= self.count or bars >= len(self._closes):
+            return np.nan
+        start = self._closes[(self.count - 1 - bars) % len(self._closes)]
+        return self.close / start - 1 if start else np.nan
+
+    @property
+    def volatility(self):
+        """Annualized standard deviation of daily log returns over the window"""
+        n = len(self._log_returns)
+        if n < 2:
+            return np.nan
+        variance = max((self._sum_sq - self._sum * self._sum / n) / (n - 1), 0.0)
+        return math.sqrt(variance * TRADING_DAYS_52W)
+
+
+class RollingStatsCache:
+    """Per-symbol trackers that consume only the bars appended since the last lookup"""
+
+    def __init__(self, max_entries=INDICATOR_CACHE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _continues(stats, data):
+        """True if data ends with the tracker's last bar unchanged or with newer bars after it"""
+        dates = data['Date'].to_numpy()
+        position = int(np.searchsorted(dates, stats.last_date, side='right')) - 1
+        return (position >= 0 and dates[position] == stats.last_date
+                and data['Close'].to_numpy()[position] == stats.close)
+
+    def stats(self, key, data):
+        """RollingWindowStats for data, extending the tracker cached under key"""
+        with self._lock:
+            stats = self._entries.get(key)
+            if stats is not None:
+                self._entries.move_to_end(key)
+            if stats is not None and self._continues(stats, data):
+                return stats.extend(data)
+
+            # New symbol, or the stored bars were revised
+            stats = RollingWindowStats.from_frame(data)
+            self._entries[key] = stats
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            return stats
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+
+# Shared instance used by the dashboard
+ROLLING_STATS_CACHE = RollingStatsCache()
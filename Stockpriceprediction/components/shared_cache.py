@@ -0,0 +1,222 @@
+"""
+Shared Cache Module
+Server-wide cache of fetched history shared by every Streamlit session, worker and replica
+
+Values are stored as Arrow IPC bytes in a pluggable backend: files under
+the cache root (one host) or a Redis-compatible server (several replicas,
+set STOCK_PROPHET_SHARED_CACHE_URL=redis://host:6379/0).
+
+Usage:
+    data = SHARED_CACHE.get_or_fetch(history_key('fmp', 'AAPL'), lambda: fetch(...))
+"""
+
+import hashlib
+import logging
+import os
+import struct
+import threading
+import time
+from datetime import date
+
+import pyarrow as pa
+
+from .arrow_io import frame_to_ipc, ipc_to_frame
+from .config import SHARED_CACHE_DIR, SHARED_CACHE_MAX_BYTES, SHARED_CACHE_TTL_SECONDS, SHARED_CACHE_URL
+from .fileutil import atomic_write
+from .singleflight import SINGLE_FLIGHT
+
+logger = logging.getLogger(__name__)
+
+# Disk entries start with the expiry time as a little-endian double
+_EXPIRY = struct.Struct('<d')
+
+
+def history_key(source, symbol, day=None):
+    """Cache key for a symbol's daily history; one entry per symbol per calendar day"""
+    return f"ohlcv:{source}:{symbol.upper()}:{(day or date.today()).isoformat()}"
+
+
+class DiskCacheBackend:
+    """Byte values in files under root, shared by every process on the host
+
+    Expired files are deleted when read and swept on every write, which
+    also drops the oldest entries while the directory exceeds max_bytes.
+    """
+
+    def __init__(self, root=SHARED_CACHE_DIR, max_bytes=SHARED_CACHE_MAX_BYTES):
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, key):
+        return os.path.join(self.root, hashlib.sha256(key.encode()).hexdigest()[:32] + '.arrows')
+
+    @staticmethod
+    def _remove(path):
+        # Readers that still map the file keep their pages (POSIX); elsewhere removal may fail until they close
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def get(self, key):
+        """Memory-mapped value (a pyarrow Buffer), or None if missing or expired"""
+        path = self._path(key)
+        try:
+            buffer = pa.memory_map(path).read_buffer()
+        except (FileNotFoundError, OSError):
+            return None
+        if len(buffer) < _EXPIRY.size or _EXPIRY.unpack(buffer[:_EXPIRY.size].to_pybytes())[0] < time.time():
+            self._remove(path)
+            return None
+        return buffer.slice(_EXPIRY.size)
+
+    def set(self, key, value, ttl):
+        with atomic_write(self._path(key)) as f:
+            f.write(_EXPIRY.pack(time.time() + ttl))
+            f.write(value)
+        self.evict()
+
+    def evict(self):
+        """Delete expired entries, then the oldest ones until the size limit holds"""
+        with self._lock:
+            try:
+                names = [n for n in os.listdir(self.root) if n.endswith('.arrows')]
+            except OSError:
+                return
+
+            now = time.time()
+            entries = []
+            for name in names:
+                path = os.path.join(self.root, name)
+                try:
+                    with open(path, 'rb') as f:
+                        header = f.read(_EXPIRY.size)
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                if len(header) < _EXPIRY.size or _EXPIRY.unpack(header)[0] < now:
+                    self._remove(path)
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            total_bytes = sum(size for _, size, _ in entries)
+            while entries and total_bytes > self.max_bytes:
+                _, size, path = entries.pop(0)
+                self._remove(path)
+                total_bytes -= size
+
+    def delete(self, key):
+        self._remove(self._path(key))
+
+
+class RedisCacheBackend:
+    """Byte values in a Redis-compatible server, shared by every replica
+
+    client is anything with Redis' get/set(ex=)/delete methods: a
+    redis.Redis instance, or LocalRedis where no server is available.
+    """
+
+    def __init__(self, client=None, url=SHARED_CACHE_URL, prefix='stock_prophet:'):
+        if client is None:
+            import redis  # optional dependency, only needed for a Redis server
+
+            client = redis.Redis.from_url(url)
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key):
+        return self.client.get(self.prefix + key)
+
+    def set(self, key, value, ttl):
+        self.client.set(self.prefix + key, value, ex=max(int(ttl), 1))
+
+    def delete(self, key):
+        self.client.delete(self.prefix + key)
+
+
+class LocalRedis:
+    """In-process stand-in for a Redis client (get/set/delete with expiry)"""
+
+    def __init__(self):
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            value, expires = self._values.get(name, (None, None))
+            if expires is not None and expires < time.time():
+                del self._values[name]
+                return None
+            return value
+
+    def set(self, name, value, ex=None):
+        with self._lock:
+            self._values[name] = (bytes(value), time.time() + ex if ex else None)
+        return True
+
+    def delete(self, *names):
+        with self._lock:
+            return sum(self._values.pop(name, None) is not None for name in names)
+
+
+class SharedDataCache:
+    """DataFrames stored as Arrow IPC in a shared backend
+
+    Backend errors (an unreachable Redis, a full disk) are logged and
+    treated as misses, so the cache can only ever save a fetch.
+    """
+
+    def __init__(self, backend, ttl=SHARED_CACHE_TTL_SECONDS):
+        self.backend = backend
+        self.ttl = ttl
+
+    def get(self, key):
+        """Cached DataFrame for key, or None"""
+        try:
+            value = self.backend.get(key)
+            return None if value is None else ipc_to_frame(value)
+        except Exception as e:
+            logger.warning("Shared cache read failed for %s: %s", key, e)
+            return None
+
+    def set(self, key, df, ttl=None):
+        try:
+            self.backend.set(key, frame_to_ipc(df), self.ttl if ttl is None else ttl)
+        except Exception as e:
+            logger.warning("Shared cache write failed for %s: %s", key, e)
+
+    def get_or_fetch(self, key, fetch, ttl=None):
+        """Cached DataFrame for key, calling fetch() and storing its result on a miss
+
+        Concurrent misses for the same key call fetch() once; the other
+        callers, in this process or (after the leader's write) in others,
+        receive its result.
+        """
+        df = self.get(key)
+        if df is None:
+            df, _ = SINGLE_FLIGHT.do(f"shared:{key}", self._fetch_and_set, key, fetch, ttl,
+                                     recheck=lambda: self.get(key))
+        return df
+
+    def _fetch_and_set(self, key, fetch, ttl):
+        df = fetch()
+        if df is not None and not df.empty:
+            self.set(key, df, ttl)
+        return df
+
+
+def default_backend():
+    """Redis when STOCK_PROPHET_SHARED_CACHE_URL is set and redis is installed, else the disk cache"""
+    if SHARED_CACHE_URL:
+        try:
+            return RedisCacheBackend(url=SHARED_CACHE_URL)
+        except ImportError:
+            logger.warning("STOCK_PROPHET_SHARED_CACHE_URL is set but the redis package is not installed; "
+                           "using the disk cache")
+    return DiskCacheBackend()
+
+
+# Shared instance used by the fetch path
+SHARED_CACHE = SharedDataCache(default_backend())
@@ -0,0 +1,89 @@
+"""
+Single Flight Module
+Coalesces concurrent identical requests (fetches, fits) into one execution
+
+Within a process, callers with the same key wait for the first caller
+(the leader) and receive its result or exception. Across processes, the
+leader also holds a file lock for the key; a leader that had to wait for
+another process re-checks the shared cache before doing the work itself.
+
+Usage:
+    data, shared = SINGLE_FLIGHT.do(key, fetch, symbol, recheck=lambda: cache.get(key))
+"""
+
+import hashlib
+import os
+import threading
+
+from .config import SINGLEFLIGHT_LOCK_DIR
+from .locks import FileLock
+
+# Keys hash onto this many lock files, which bounds the lock directory;
+# two keys sharing a stripe only serialize, so calls must not nest.
+LOCK_STRIPES = 1024
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Keyed call coalescing across threads and, through file locks, across processes"""
+
+    def __init__(self, lock_dir=SINGLEFLIGHT_LOCK_DIR, stripes=LOCK_STRIPES):
+        self.lock_dir = lock_dir
+        self.stripes = stripes
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def _file_lock(self, key):
+        stripe = int(hashlib.sha256(key.encode()).hexdigest()[:8], 16) % self.stripes
+        return FileLock(os.path.join(self.lock_dir, f"{stripe:04d}.lock"))
+
+    def do(self, key, fn, *args, recheck=None, **kwargs):
+        """Run fn(*args, **kwargs) once for all concurrent callers with key; returns (result, shared)
+
+        shared is True for callers that received another thread's result
+        (the same object, so treat it as read-only). recheck, if given, is
+        called by the leader once it holds the file lock; a non-None value
+        (typically a cache hit written by another process) is returned
+        instead of calling fn.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result, True
+
+        try:
+            with self._file_lock(key):
+                result = recheck() if recheck is not None else None
+                if result is None:
+                    result = fn(*args, **kwargs)
+            call.result = result
+            return result, False
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+    def in_flight(self):
+        """Keys currently being computed in this process"""
+        with self._lock:
+            return list(self._calls)
+
+
+# Shared instance used by the fetch path and model training
+SINGLE_FLIGHT = SingleFlight()
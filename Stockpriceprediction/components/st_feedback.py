@@ -0,0 +1,30 @@
+"""
+Streamlit Feedback Module
+Renders core-layer progress messages and structured errors in Streamlit
+"""
+
+import streamlit as st
+
+from .exceptions import APILimitError
+
+_PROGRESS_RENDERERS = {
+    'success': lambda message: st.success(f"✅ {message}"),
+    'warning': lambda message: st.warning(f"⚠️ {message}"),
+}
+
+
+def show_progress(level, message):
+    """Progress callback for core functions (plain info messages are covered by spinners)"""
+    renderer = _PROGRESS_RENDERERS.get(level)
+    if renderer:
+        renderer(message)
+
+
+def show_error(error):
+    """Display a StockProphetError and its hint, if any"""
+    st.error(f"❌ {error.message}")
+    if error.hint:
+        if isinstance(error, APILimitError):
+            st.info(f"⏰ {error.hint}")
+        else:
+            st.warning(f"💡 **Tip:** {error.hint}")
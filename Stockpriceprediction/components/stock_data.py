@@ -144,6 +144,12 @@ API_COMPARISON_DATA = """
 | **🏢 Corporate Network** | ✅ | ✅ | ✅ |
 """
 
+# Request limits per data source (free tiers)
+API_RATE_LIMITS = {
+    "alpha_vantage": {"per_minute": 5, "per_day": 25},
+    "fmp": {"per_minute": 300, "per_day": 250},
+}
+
 # Data source configurations
 DATA_SOURCE_CONFIG = {
     "🔵 Alpha Vantage API": {
@@ -190,4 +196,8 @@ DATA_SOURCE_CONFIG = {
         - Date format: YYYY-MM-DD
         """
     }
-} 
\ No newline at end of file
+} 
+
+# Forecast horizons offered in the UI; materialized forecasts cover the longest one
+FORECAST_HORIZON_MONTHS = [1, 2, 3, 6, 9, 12, 18, 24]
+FORECAST_HORIZON_YEARS = [1, 2, 3, 4, 5]
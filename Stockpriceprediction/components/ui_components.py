@@ -4,12 +4,16 @@ Contains all Streamlit UI components and interface elements
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-from plotly import graph_objs as go
-from prophet.plot import plot_plotly
+from .config import CHART_MAX_POINTS
+from .downsampling import downsample_indices, use_webgl, window
 from .stock_data import POPULAR_STOCKS, API_COMPARISON_DATA, DATA_SOURCE_CONFIG
 from .data_sources import DataSources
 
+# Zoom presets for price charts (calendar days; None shows the full history)
+ZOOM_WINDOWS = {"1M": 31, "6M": 183, "1Y": 365, "5Y": 1826, "All": None}
+
 class UIComponents:
     """Centralized UI components for the Stock Prophet app"""
     
@@ -789,18 +793,59 @@ class UIComponents:
         if data is not None:
             st.dataframe(data.tail())
     
+    @staticmethod
+    def render_zoom_control(dates, key):
+        """Zoom presets for long charts; returns the slice of dates to plot
+
+        Each zoom level is downsampled again on its own, so narrowing the
+        window brings back full daily detail instead of stretching the
+        downsampled overview.
+        """
+        choice = st.radio("🔎 Zoom:", list(ZOOM_WINDOWS), index=len(ZOOM_WINDOWS) - 1,
+                          horizontal=True, key=key)
+        days = ZOOM_WINDOWS[choice]
+        if days is None or len(dates) == 0:
+            return slice(None)
+        end = pd.Timestamp(dates[-1])
+        return window(dates, end - pd.Timedelta(days=days), end)
+
+    @staticmethod
+    def line_trace(x, y, max_points=CHART_MAX_POINTS, **trace_kwargs):
+        """Line trace downsampled (LTTB) to max_points; long undownsampled series use WebGL"""
+        from plotly import graph_objs as go
+
+        x, y = np.asarray(x), np.asarray(y)
+        indices = downsample_indices(x, y, max_points)
+        if indices is not None:
+            x, y = x[indices], y[indices]
+
+        # Compact encoding: plain dates for daily data and 4-byte floats (plotly sends arrays as binary)
+        if np.issubdtype(x.dtype, np.datetime64):
+            x = x.astype('datetime64[ns]')
+            if (x.view(np.int64) % (86400 * 10**9) == 0).all():
+                x = np.datetime_as_string(x, unit='D')
+        if np.issubdtype(y.dtype, np.floating):
+            y = y.astype(np.float32)
+
+        trace_class = go.Scattergl if use_webgl(len(y)) else go.Scatter
+        return trace_class(x=x, y=y, mode='lines', **trace_kwargs)
+
     @staticmethod
     def render_interactive_chart(data, selected_stock):
         """Render interactive chart with dark theme and blue lines"""
         if data is not None:
+            from plotly import graph_objs as go
+
+            dates = data['Date'].to_numpy() if 'Date' in data.columns else data.index.to_numpy()
+            visible = UIComponents.render_zoom_control(dates, key=f"zoom_prediction_{selected_stock}")
+
             # Create plotly figure with dark theme
             fig = go.Figure()
             
             # Add price line with blue color
-            fig.add_trace(go.Scatter(
-                x=data.index,
-                y=data['Close'],
-                mode='lines',
+            fig.add_trace(UIComponents.line_trace(
+                dates[visible],
+                data['Close'].to_numpy()[visible],
                 name='Close Price',
                 line=dict(color='#667eea', width=2.5),
                 hovertemplate='<b>Date:</b> %{x}<br><b>Price:</b> $%{y:.2f}<extra></extra>'
@@ -850,15 +895,140 @@ class UIComponents:
         st.metric("Predicted Price", f"${future_price:.2f}")
     
     @staticmethod
-    def render_forecast_chart(model, forecast):
-        """Render forecast chart"""
-        st.success("✅ Forecast chart rendered")
+    def render_forecast_chart(history, forecast, selected_stock=None, max_points=CHART_MAX_POINTS):
+        """Render history (a ds/y frame), predicted price and confidence band from the forecast arrays
+
+        Replaces prophet.plot.plot_plotly, which serializes every row of the
+        forecast frame: history and forecast are each downsampled (LTTB on
+        yhat, with the band taken at the same dates), so the payload stays
+        bounded at any horizon.
+        """
+        from plotly import graph_objs as go
+
+        history_ds = history['ds'].to_numpy()
+        history_y = history['y'].to_numpy()
+        ds = forecast['ds'].to_numpy()
+        yhat = forecast['yhat'].to_numpy()
+
+        indices = downsample_indices(ds, yhat, max_points)
+        if indices is not None:
+            ds, yhat = ds[indices], yhat[indices]
+
+        fig = go.Figure()
+        if 'yhat_lower' in forecast.columns and 'yhat_upper' in forecast.columns:
+            lower = forecast['yhat_lower'].to_numpy()
+            upper = forecast['yhat_upper'].to_numpy()
+            if indices is not None:
+                lower, upper = lower[indices], upper[indices]
+            fig.add_trace(UIComponents.line_trace(
+                ds, upper, max_points=None, name='Upper Bound',
+                line=dict(width=0), hoverinfo='skip', showlegend=False
+            ))
+            fig.add_trace(UIComponents.line_trace(
+                ds, lower, max_points=None, name='Confidence Band',
+                line=dict(width=0), fill='tonexty', fillcolor='rgba(102, 126, 234, 0.2)', hoverinfo='skip'
+            ))
+
+        fig.add_trace(UIComponents.line_trace(
+            history_ds, history_y, max_points=max_points, name='Actual Price',
+            line=dict(color='#e0e6ed', width=1.5),
+            hovertemplate='<b>Date:</b> %{x}<br><b>Actual:</b> $%{y:.2f}<extra></extra>'
+        ))
+        fig.add_trace(UIComponents.line_trace(
+            ds, yhat, max_points=None, name='Predicted Price',
+            line=dict(color='#667eea', width=2.5),
+            hovertemplate='<b>Date:</b> %{x}<br><b>Predicted:</b> $%{y:.2f}<extra></extra>'
+        ))
+        fig.add_vline(x=pd.Timestamp(history_ds[-1]), line=dict(color='#ffa726', width=1.5, dash='dash'))
+
+        title = f'🔮 {selected_stock} Price Forecast' if selected_stock else '🔮 Price Forecast'
+        _apply_dark_theme(fig, title, height=500, y_title='Price ($)')
+        fig.update_layout(showlegend=True, legend=dict(orientation='h', y=-0.15))
+        st.plotly_chart(fig, use_container_width=True)
     
     @staticmethod
-    def render_forecast_components(model, forecast):
-        """Render forecast components"""
-        st.info("📊 Forecast components analysis")
+    def render_forecast_components(forecast, max_points=CHART_MAX_POINTS):
+        """Render trend and weekly/yearly seasonality from the forecast columns
+
+        Seasonal components are averaged by weekday and day of year with
+        np.bincount, so they cost 7 and 366 points regardless of horizon.
+        Backends without seasonality (linear, exponential) show the trend only.
+        """
+        from plotly.subplots import make_subplots
+
+        ds = forecast['ds'].to_numpy()
+        panels = [('📈 Trend', ds, forecast['trend'].to_numpy(), max_points)]
+
+        dates = pd.DatetimeIndex(ds)
+        if 'weekly' in forecast.columns:
+            weekday = dates.dayofweek.to_numpy()
+            weekly = (np.bincount(weekday, weights=forecast['weekly'].to_numpy(), minlength=7)
+                      / np.maximum(np.bincount(weekday, minlength=7), 1))
+            panels.append(('📅 Weekly Seasonality',
+                           np.array(['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']), weekly, None))
+        if 'yearly' in forecast.columns:
+            day_of_year = dates.dayofyear.to_numpy() - 1
+            counts = np.bincount(day_of_year, minlength=366)
+            sums = np.bincount(day_of_year, weights=forecast['yearly'].to_numpy(), minlength=366)
+            observed = counts > 0
+            days = np.datetime64('2001-01-01') + np.arange(366)
+            panels.append(('🗓️ Yearly Seasonality', days[observed], sums[observed] / counts[observed], None))
+
+        fig = make_subplots(rows=len(panels), cols=1, subplot_titles=[panel[0] for panel in panels],
+                            vertical_spacing=0.12)
+        for row, (name, x, y, points) in enumerate(panels, start=1):
+            fig.add_trace(UIComponents.line_trace(
+                x, y, max_points=points, name=name, line=dict(color='#667eea', width=2),
+                hovertemplate='%{x}<br>%{y:.2f}<extra></extra>'
+            ), row=row, col=1)
+        if 'yearly' in forecast.columns:
+            fig.update_xaxes(tickformat='%b %d', row=len(panels), col=1)
+
+        _apply_dark_theme(fig, None, height=300 * len(panels))
+        fig.update_xaxes(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed')
+        fig.update_yaxes(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed')
+        fig.update_annotations(font=dict(color='#667eea', size=15))
+        st.plotly_chart(fig, use_container_width=True)
     
+    @staticmethod
+    def render_indicator_chart(data, indicators, visible=slice(None), max_points=CHART_MAX_POINTS):
+        """Render price with moving averages and Bollinger bands, RSI and MACD for the visible rows"""
+        from plotly.subplots import make_subplots
+
+        dates = data['Date'].to_numpy()[visible]
+        column = lambda name: indicators[name].to_numpy()[visible]
+        fig = make_subplots(rows=3, cols=1, shared_xaxes=True, row_heights=[0.5, 0.25, 0.25],
+                            vertical_spacing=0.08,
+                            subplot_titles=['💹 Price, SMA 50/200 & Bollinger Bands', '⚡ RSI (14)', '📊 MACD'])
+        panels = [
+            (1, 'BB_upper', '#8892b0', 1, 'dot'), (1, 'BB_lower', '#8892b0', 1, 'dot'),
+            (1, 'SMA_50', '#ffb86c', 1.5, None), (1, 'SMA_200', '#ff6b6b', 1.5, None),
+            (2, 'RSI_14', '#667eea', 1.5, None),
+            (3, 'MACD', '#667eea', 1.5, None), (3, 'MACD_signal', '#ffb86c', 1.5, None),
+        ]
+        fig.add_trace(UIComponents.line_trace(
+            dates, data['Close'].to_numpy()[visible], max_points=max_points, name='Close',
+            line=dict(color='#e0e6ed', width=1.5), hovertemplate='$%{y:.2f}'
+        ), row=1, col=1)
+        for row, name, color, width, dash in panels:
+            fig.add_trace(UIComponents.line_trace(
+                dates, column(name), max_points=max_points, name=name,
+                line=dict(color=color, width=width, dash=dash), hovertemplate='%{y:.2f}'
+            ), row=row, col=1)
+        fig.add_trace(UIComponents.line_trace(
+            dates, column('MACD_hist'), max_points=max_points, name='Histogram', fill='tozeroy',
+            line=dict(color='rgba(102, 126, 234, 0.4)', width=0), hovertemplate='%{y:.2f}'
+        ), row=3, col=1)
+        for level in (30, 70):
+            fig.add_hline(y=level, line=dict(color='rgba(255,255,255,0.3)', dash='dash', width=1), row=2, col=1)
+
+        _apply_dark_theme(fig, None, height=750)
+        fig.update_xaxes(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed')
+        fig.update_yaxes(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed')
+        fig.update_yaxes(range=[0, 100], row=2, col=1)
+        fig.update_annotations(font=dict(color='#667eea', size=15))
+        st.plotly_chart(fig, use_container_width=True)
+
     @staticmethod
     def render_forecast_details(forecast):
         """Render forecast details"""
@@ -868,4 +1038,23 @@ class UIComponents:
     def render_disclaimer():
         """Render disclaimer"""
         st.markdown("---")
-        st.caption("⚠️ This is for educational purposes only. Not financial advice.")
\ No newline at end of file
+        st.caption("⚠️ This is for educational purposes only. Not financial advice.")
+
+
+def _apply_dark_theme(fig, title, height, y_title=None):
+    """Dark blue layout shared by the forecast charts"""
+    fig.update_layout(
+        plot_bgcolor='rgba(25, 42, 86, 0.8)',
+        paper_bgcolor='rgba(0,0,0,0)',
+        font=dict(color='#e0e6ed', family='Inter, -apple-system, BlinkMacSystemFont, sans-serif'),
+        title=dict(text=title, x=0.5, font=dict(size=20, color='#667eea', family='Inter', weight=600))
+        if title else None,
+        xaxis=dict(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed', showgrid=True, zeroline=False),
+        yaxis=dict(gridcolor='rgba(255,255,255,0.15)', color='#e0e6ed', showgrid=True, zeroline=False,
+                   title=dict(text=y_title, font=dict(size=14, color='#c0c5ca')) if y_title else None),
+        hovermode='x unified',
+        margin=dict(l=40, r=40, t=80, b=40),
+        height=height,
+        showlegend=False,
+        hoverlabel=dict(bgcolor='rgba(30, 30, 50, 0.95)', font_color='white', bordercolor='#667eea')
+    )
@@ -0,0 +1,13 @@
+"""
+Test configuration
+Puts the app directory on sys.path and points every cache at a temporary directory
+"""
+
+import os
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Read by components.config at import, so it must be set before any component is imported
+os.environ['STOCK_PROPHET_CACHE_DIR'] = tempfile.mkdtemp(prefix='stock_prophet_tests_')
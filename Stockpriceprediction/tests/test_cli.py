@@ -0,0 +1,60 @@
+"""
+Command Line Interface Tests
+"""
+
+import os
+import subprocess
+import sys
+
+import numpy as np
+import pandas as pd
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def run_cli(*args):
+    return subprocess.run([sys.executable, '-m', 'Stockpriceprediction', *args], cwd=REPO_ROOT,
+                          capture_output=True, text=True, env=os.environ.copy(), timeout=300)
+
+
+@pytest.fixture
+def universe_csv(tmp_path):
+    """Long-format file with AAA trading near $10 and BBB near $500"""
+    dates = pd.bdate_range('2022-01-03', periods=300)
+    frames = []
+    for symbol, level in [('AAA', 10.0), ('BBB', 500.0)]:
+        close = level + np.linspace(0, level * 0.1, len(dates))
+        frames.append(pd.DataFrame({'Symbol': symbol, 'Date': dates.strftime('%Y-%m-%d'), 'Open': close,
+                                    'High': close * 1.01, 'Low': close * 0.99, 'Close': close,
+                                    'Volume': 1000}))
+    path = tmp_path / 'universe.csv'
+    pd.concat(frames).to_csv(path, index=False)
+    return str(path)
+
+
+def test_forecast_csv_picks_the_named_symbol(universe_csv):
+    result = run_cli('forecast', 'AAA', '--csv', universe_csv, '--model', 'linear')
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.startswith("AAA: current $11.00 -> ")
+
+
+def test_fetch_csv_returns_only_the_named_symbol(universe_csv, tmp_path):
+    output = str(tmp_path / 'bbb.csv')
+    result = run_cli('fetch', 'BBB', '--csv', universe_csv, '--output', output)
+    assert result.returncode == 0, result.stderr
+    fetched = pd.read_csv(output)
+    assert len(fetched) == 300
+    assert fetched['Close'].between(500, 550).all()
+
+
+def test_forecast_multi_symbol_csv_without_symbol_points_to_batch(universe_csv):
+    result = run_cli('forecast', '--csv', universe_csv, '--model', 'linear')
+    assert result.returncode != 0
+    assert "batch --input" in result.stderr
+
+
+def test_forecast_csv_unknown_symbol_lists_symbols(universe_csv):
+    result = run_cli('forecast', 'CCC', '--csv', universe_csv, '--model', 'linear')
+    assert result.returncode != 0
+    assert "AAA, BBB" in result.stderr
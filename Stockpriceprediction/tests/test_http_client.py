@@ -0,0 +1,62 @@
+"""
+HTTP Client Tests
+"""
+
+import json
+
+from components.http_client import HTTPClient
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, etag=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.content = json.dumps(payload).encode() if payload is not None else b''
+        self.headers = {'ETag': etag} if etag else {}
+
+    def json(self):
+        return json.loads(self.content)
+
+
+class FakeSession:
+    """Serves one payload per URL with an ETag, answering 304 when it is presented again"""
+
+    def __init__(self, payloads):
+        self.payloads = payloads
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.requests.append((url, headers))
+        etag = f'"{url}"'
+        if headers.get('If-None-Match') == etag:
+            return FakeResponse(304)
+        return FakeResponse(200, self.payloads[url], etag)
+
+
+def client_with(payloads, max_bytes):
+    client = HTTPClient(validator_max_bytes=max_bytes)
+    client.session = FakeSession(payloads)
+    return client
+
+
+def test_not_modified_response_reuses_cached_body():
+    client = client_with({'a': {'value': 1}}, max_bytes=1024)
+    assert client.get_json('a') == {'value': 1}
+    assert client.get_json('a') == {'value': 1}
+    assert client.session.requests[-1][1] == {'If-None-Match': '"a"'}
+
+
+def test_validator_cache_is_bounded_by_bytes():
+    payloads = {url: {'data': url * 40} for url in 'abc'}
+    size = len(json.dumps(payloads['a']).encode())
+    client = client_with(payloads, max_bytes=2 * size)
+    for url in 'abc':
+        client.get_json(url)
+
+    assert list(client._validators) == [('b', ()), ('c', ())]
+    assert client._validator_bytes == 2 * size
+
+    # Bodies larger than the whole budget are never kept
+    client = client_with({'big': {'data': 'x' * 100}}, max_bytes=10)
+    client.get_json('big')
+    assert not client._validators
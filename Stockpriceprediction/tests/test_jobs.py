@@ -0,0 +1,60 @@
+"""
+Jobs Tests
+"""
+
+import threading
+
+import pytest
+
+from components.jobs import FAILED, JobQueue, process_pool
+from components.singleflight import SINGLE_FLIGHT
+
+
+def fail():
+    raise ValueError("bad input")
+
+
+@pytest.fixture
+def queue():
+    queue = JobQueue(max_workers=1)
+    yield queue
+    queue.shutdown()
+
+
+def test_failed_job_is_reused_until_forgotten(queue):
+    job = queue.submit('key', fail)
+    with pytest.raises(ValueError):
+        job.result(timeout=5)
+    assert job.status == FAILED
+
+    # A rerun submitting the same key gets the failure to report, not a new fit
+    assert queue.submit('key', fail) is job
+
+    assert queue.forget(job.id)
+    retried = queue.submit('key', fail)
+    assert retried is not job
+    assert queue.get(job.id) is None
+
+
+def flight_keys():
+    return SINGLE_FLIGHT.in_flight()
+
+
+def test_pool_workers_do_not_inherit_locks_held_by_other_threads():
+    held, release = threading.Event(), threading.Event()
+
+    def hold():
+        with SINGLE_FLIGHT._lock:
+            held.set()
+            release.wait(30)
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    held.wait()
+    try:
+        # Workers start while another thread holds the lock, as fetch threads do in run_batch
+        with process_pool(1) as pool:
+            assert pool.submit(flight_keys).result(timeout=60) == []
+    finally:
+        release.set()
+        holder.join()
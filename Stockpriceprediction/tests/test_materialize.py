@@ -0,0 +1,64 @@
+"""
+Materialize Tests
+"""
+
+import shutil
+import time
+from datetime import date, datetime
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from components import market_data, materialize
+from components.ohlcv_store import OHLCV_STORE
+from components.shared_cache import SHARED_CACHE
+
+
+class FakeProvider:
+    """Stands in for fetch_fmp: 300 daily bars ending today, the last one at self.last_close"""
+
+    def __init__(self):
+        self.last_close = 10.0
+        self.start_dates = []
+
+    def __call__(self, symbol, api_key, start_date=market_data.FMP_START, progress=None, max_wait=None):
+        self.start_dates.append(start_date)
+        dates = pd.bdate_range(end=date.today(), periods=300)
+        close = np.full(len(dates), 10.0)
+        close[-1] = self.last_close
+        bars = pd.DataFrame({'Date': dates, 'Open': close, 'High': close, 'Low': close, 'Close': close,
+                             'Volume': 1000.0})
+        return bars[bars['Date'] >= pd.Timestamp(start_date)].reset_index(drop=True)
+
+
+@pytest.fixture
+def provider(monkeypatch):
+    # materialize runs through the default store and shared cache; start each test without history
+    shutil.rmtree(OHLCV_STORE.root, ignore_errors=True)
+    shutil.rmtree(SHARED_CACHE.backend.root, ignore_errors=True)
+    provider = FakeProvider()
+    monkeypatch.setattr(market_data, 'fetch_fmp', provider)
+    return provider
+
+
+def test_forecast_computed_before_the_close_is_recomputed_after_it(provider, monkeypatch, tmp_path):
+    store = materialize.ForecastStore(root=str(tmp_path / 'forecasts'))
+    run = lambda: materialize.materialize('fmp', 'key', ['AAA'], ('linear',), max_workers=1, store=store)
+
+    # Intraday: the stored history and the shared cache now hold a snapshot of today's bar
+    assert run()['current_price'].iloc[0] == pytest.approx(10.0)
+
+    time.sleep(0.05)
+    close = datetime.now(materialize.MARKET_TIMEZONE)
+    monkeypatch.setattr(materialize, 'last_market_close', lambda now=None: close)
+    provider.last_close = 12.0
+    assert store.needs_refresh('fmp', 'AAA', 'linear')
+
+    results = run()
+    assert results['status'].iloc[0] == 'ok'
+    assert results['current_price'].iloc[0] == pytest.approx(12.0)
+    # Refetched from the snapshot bar, which the final bar replaced
+    assert provider.start_dates[-1] == pd.bdate_range(end=date.today(), periods=1)[0].strftime("%Y-%m-%d")
+    assert store.metadata('fmp', 'AAA', 'linear')['computed_at'] >= close.timestamp()
+    assert not store.needs_refresh('fmp', 'AAA', 'linear')
@@ -0,0 +1,21 @@
+"""
+Models Tests
+"""
+
+import pytest
+
+from components.models import ExponentialGrowthModel, ForecastModel, LinearTrendModel
+
+
+def test_incomplete_backend_fails_at_construction():
+    class FitOnly(ForecastModel):
+        def fit(self, df):
+            return self
+
+    with pytest.raises(TypeError):
+        FitOnly()
+
+
+def test_shipped_backends_are_complete():
+    LinearTrendModel()
+    ExponentialGrowthModel()
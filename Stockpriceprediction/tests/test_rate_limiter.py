@@ -0,0 +1,80 @@
+"""
+Rate Limiter Tests
+"""
+
+import threading
+
+import pytest
+
+from components import market_data, rate_limiter
+from components.exceptions import APILimitError
+from components.ohlcv_store import OHLCVStore
+from components.rate_limiter import QuotaTracker, RateLimiter
+from components.shared_cache import LocalRedis, RedisCacheBackend, SharedDataCache
+
+
+class FakeClock:
+    """Stands in for the time module: sleeping advances the clock instead of blocking"""
+
+    def __init__(self):
+        self.now = 0.0
+        self._lock = threading.Lock()
+
+    def monotonic(self):
+        with self._lock:
+            return self.now
+
+    def sleep(self, seconds):
+        with self._lock:
+            self.now += seconds
+
+
+def alpha_vantage_payload(symbol):
+    return {"Time Series (Daily)": {
+        day: {"1. open": "10", "2. high": "11", "3. low": "9", "4. close": "10", "5. volume": "1000"}
+        for day in ["2024-01-02", "2024-01-03", "2024-01-04"]
+    }}
+
+
+@pytest.fixture
+def limiter(tmp_path, monkeypatch):
+    monkeypatch.setattr(rate_limiter, 'time', FakeClock())
+    # A tiny interactive wait, so only an unbounded batch wait can get every symbol through
+    limiter = RateLimiter(limits={'alpha_vantage': {'per_minute': 5, 'per_day': 25}},
+                          quota=QuotaTracker(str(tmp_path / 'quota.json')), max_wait=0.01)
+    monkeypatch.setattr(market_data, 'RATE_LIMITER', limiter)
+    monkeypatch.setattr(market_data, '_get_json', lambda url, params, source, symbol: alpha_vantage_payload(symbol))
+    return limiter
+
+
+def fetch(symbols, tmp_path):
+    """Fetch through a store and shared cache private to the test"""
+    return market_data.fetch_many_sync(symbols, 'alpha_vantage', 'key', concurrency=8,
+                                       store=OHLCVStore(root=str(tmp_path / 'ohlcv')),
+                                       shared_cache=SharedDataCache(RedisCacheBackend(LocalRedis())))
+
+
+def test_batch_fetch_beyond_per_minute_limit_succeeds(limiter, tmp_path):
+    symbols = [f"S{i}" for i in range(12)]
+    results = fetch(symbols, tmp_path)
+
+    failed = {symbol: result for symbol, result in results.items() if isinstance(result, Exception)}
+    assert not failed
+    assert all(len(results[symbol]) == 3 for symbol in symbols)
+    assert limiter.remaining('alpha_vantage', 'key') == 25 - len(symbols)
+
+
+def test_batch_fetch_fails_only_when_daily_quota_is_used_up(limiter, tmp_path):
+    symbols = [f"S{i}" for i in range(30)]
+    results = fetch(symbols, tmp_path)
+
+    failed = [result for result in results.values() if isinstance(result, Exception)]
+    assert len(failed) == 5
+    assert all(isinstance(error, rate_limiter.QuotaExceededError) for error in failed)
+
+
+def test_interactive_acquire_still_times_out(limiter):
+    for _ in range(5):
+        limiter.acquire('alpha_vantage', 'key')
+    with pytest.raises(APILimitError):
+        limiter.acquire('alpha_vantage', 'key')
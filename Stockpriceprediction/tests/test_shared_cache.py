@@ -0,0 +1,29 @@
+"""
+Shared Cache Tests
+"""
+
+import os
+
+from components.shared_cache import DiskCacheBackend
+
+
+def test_expired_entry_is_deleted_on_read(tmp_path):
+    backend = DiskCacheBackend(root=str(tmp_path))
+    backend.set('key', b'value', ttl=-1)
+    backend.evict = lambda: None  # keep the file so get() is what removes it
+
+    assert backend.get('key') is None
+    assert not os.path.exists(backend._path('key'))
+
+
+def test_set_sweeps_expired_entries_and_caps_size(tmp_path):
+    backend = DiskCacheBackend(root=str(tmp_path), max_bytes=2500)
+    backend.set('expired', b'x' * 1000, ttl=-1)
+    for key in ['a', 'b', 'c']:
+        backend.set(key, key.encode() * 1000, ttl=60)
+        # Distinct modification times so eviction order is deterministic
+        os.utime(backend._path(key), (len(os.listdir(tmp_path)),) * 2)
+
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(backend._path(key)) for key in ['b', 'c'])
+    assert backend.get('a') is None
+    assert bytes(backend.get('c')) == b'c' * 1000